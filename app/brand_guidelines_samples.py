@@ -2,7 +2,9 @@ from __future__ import annotations
 
 import json
 import re
+import time
 from dataclasses import dataclass
+from functools import lru_cache
 from pathlib import Path
 from typing import Any
 
@@ -16,6 +18,9 @@ def _sanitize_id(value: str) -> str:
     return value
 
 
+_STATIC_ROOT = Path(__file__).resolve().parent / "static"
+
+
 def _samples_root() -> Path:
     # <repo>/app/static/tools/brand-guidelines/samples
     return Path(__file__).resolve().parent / "static" / "tools" / "brand-guidelines" / "samples"
@@ -29,13 +34,32 @@ class BrandGuidelinesSample:
     data: dict[str, Any]
 
 
+# (signature, samples) from the last scan; see `_samples_signature`.
+_samples_cache: tuple[tuple[tuple[str, int], ...], list[BrandGuidelinesSample]] | None = None
+
+
+def _samples_signature(root: Path) -> tuple[tuple[str, int], ...]:
+    # Stats only: any added, removed or edited sample.json changes the signature.
+    return tuple((str(p), p.stat().st_mtime_ns) for p in sorted(root.glob("*/sample.json")))
+
+
 def list_brand_guidelines_samples() -> list[BrandGuidelinesSample]:
+    """
+    List the bundled samples, re-reading the JSON files only when one of them
+    changed since the last call.
+    """
+    global _samples_cache
     root = _samples_root()
     if not root.exists():
         return []
 
+    signature = _samples_signature(root)
+    if _samples_cache is not None and _samples_cache[0] == signature:
+        return list(_samples_cache[1])
+
     out: list[BrandGuidelinesSample] = []
-    for sample_json in sorted(root.glob("*/sample.json")):
+    for sample_path, _ in signature:
+        sample_json = Path(sample_path)
         try:
             data = json.loads(sample_json.read_text(encoding="utf-8"))
         except Exception:
@@ -51,7 +75,8 @@ def list_brand_guidelines_samples() -> list[BrandGuidelinesSample]:
         out.append(BrandGuidelinesSample(id=sample_id, name=name, description=description, data=data))
 
     out.sort(key=lambda s: s.name.lower())
-    return out
+    _samples_cache = (signature, out)
+    return list(out)
 
 
 def load_brand_guidelines_sample(sample_id: str) -> dict[str, Any]:
@@ -80,7 +105,6 @@ def resolve_static_paths(sample: dict[str, Any]) -> dict[str, Any]:
     if not isinstance(images, list):
         return sample
 
-    static_root = Path(__file__).resolve().parent / "static"
     for img in images:
         if not isinstance(img, dict):
             continue
@@ -89,7 +113,29 @@ def resolve_static_paths(sample: dict[str, Any]) -> dict[str, Any]:
             img["exists"] = False
             continue
         rel = src[len("/static/") :]
-        img["exists"] = (static_root / rel).exists()
+        img["exists"] = (_STATIC_ROOT / rel).exists()
 
     return sample
 
+
+# Image `exists` flags are re-checked at most this often, so dropping a draft
+# asset into place shows up without restarting.
+RESOLVED_SAMPLE_TTL_S = 5.0
+
+
+def load_resolved_sample(sample_id: str) -> dict[str, Any]:
+    """
+    `load_brand_guidelines_sample` + `resolve_static_paths`, memoized until the
+    sample's JSON file changes or the TTL lapses. The returned dict is shared;
+    treat it as read-only.
+    """
+    safe = _sanitize_id(sample_id)
+    if not safe:
+        raise FileNotFoundError("Invalid sample id")
+    mtime_ns = (_samples_root() / safe / "sample.json").stat().st_mtime_ns
+    return _resolved_sample(safe, mtime_ns, int(time.monotonic() // RESOLVED_SAMPLE_TTL_S))
+
+
+@lru_cache(maxsize=64)
+def _resolved_sample(safe_id: str, mtime_ns: int, ttl_bucket: int) -> dict[str, Any]:
+    return resolve_static_paths(load_brand_guidelines_sample(safe_id))
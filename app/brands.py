@@ -2,6 +2,7 @@ from __future__ import annotations
 
 import json
 from dataclasses import dataclass
+from functools import lru_cache
 from pathlib import Path
 from typing import Any
 
@@ -17,16 +18,36 @@ def _brands_dir() -> Path:
     return Path(__file__).resolve().parent / "static" / "brands"
 
 
+def _brands_signature(base: Path) -> tuple[tuple[str, int], ...]:
+    # Stats only: any added, removed or edited brand.json changes the signature.
+    return tuple((str(p), p.stat().st_mtime_ns) for p in sorted(base.glob("*/brand.json")))
+
+
 def list_brands() -> list[BrandSpec]:
     """
     Discover brands from `app/static/brands/<brand>/brand.json`.
 
     This keeps the "brand list" data-driven, so generators/tools can work across
-    multiple brands without code changes.
+    multiple brands without code changes. The JSON files are only re-read when
+    one of them was added, removed or edited since the last call.
     """
+    return list(_discover_brands(_brands_signature(_brands_dir())))
+
+
+def list_brand_ids() -> frozenset[str]:
+    return _brand_ids(_brands_signature(_brands_dir()))
+
+
+@lru_cache(maxsize=1)
+def _brand_ids(signature: tuple[tuple[str, int], ...]) -> frozenset[str]:
+    return frozenset(b.id for b in _discover_brands(signature))
+
+
+@lru_cache(maxsize=1)
+def _discover_brands(signature: tuple[tuple[str, int], ...]) -> tuple[BrandSpec, ...]:
     base = _brands_dir()
     if not base.exists():
-        return []
+        return ()
 
     brands: list[BrandSpec] = []
     for brand_dir in sorted([p for p in base.iterdir() if p.is_dir()], key=lambda p: p.name.lower()):
@@ -49,7 +70,7 @@ def list_brands() -> list[BrandSpec]:
         brands.append(BrandSpec(id=brand_id, name=name, logo_url=logo_url))
 
     brands.sort(key=lambda b: (b.name.lower(), b.id.lower()))
-    return brands
+    return tuple(brands)
 
 
 def load_brand_config(brand_id: str) -> dict[str, Any] | None:
@@ -27,6 +27,9 @@ class Settings(BaseSettings):
         default=None, description="Optional SharePoint site ID (not required for basic drive usage)"
     )
 
+    # Builtin tools run on a dedicated pool so a slow tool cannot stall the event loop.
+    tool_workers: int = Field(default=4, description="Threads available for running builtin tools")
+
     class Config:
         env_prefix = "MR_"
         env_file = ".env"
@@ -1,5 +1,6 @@
+import bisect
 import logging
-from typing import List
+from typing import List, Sequence, Tuple
 
 from .schemas import (
     LedgerEntryCreate,
@@ -11,6 +12,10 @@ from .sharepoint_client import graph_client
 logger = logging.getLogger(__name__)
 
 
+def _newest_first(entry: LedgerEntryNormalized) -> float:
+    return -entry.created_at.timestamp()
+
+
 class LedgerService:
     """
     Handles creation + upload of structured ledger entries.
@@ -20,7 +25,25 @@ class LedgerService:
     """
 
     def __init__(self) -> None:
+        # Kept newest-first on insert so reads never need to sort.
         self._in_memory: List[LedgerEntryNormalized] = []
+        # Bumped on every append; list endpoints derive their ETag from it.
+        self.version = 0
+
+    @staticmethod
+    def _document_location(entry: LedgerEntryNormalized) -> Tuple[str, str]:
+        filename = f"{entry.created_at.isoformat().replace(':', '-')}_{entry.id}.json"
+        return filename, f"ledger/{entry.month_tag}"
+
+    def _remember(self, entry: LedgerEntryNormalized) -> None:
+        bisect.insort(self._in_memory, entry, key=_newest_first)
+        self.version += 1
+        logger.info(
+            "Ledger entry recorded id=%s theme=%s lens=%s",
+            entry.id,
+            entry.theme,
+            entry.lens,
+        )
 
     async def log_entry(
         self,
@@ -30,9 +53,7 @@ class LedgerService:
         actor: str | None = None,
     ) -> LedgerEntryNormalized:
         entry = build_ledger_entry(payload, source=source, actor=actor)
-        year_month = entry.month_tag
-        filename = f"{entry.created_at.isoformat().replace(':', '-')}_{entry.id}.json"
-        subfolder = f"ledger/{year_month}"
+        filename, subfolder = self._document_location(entry)
 
         await graph_client.upload_json_document(
             entry.model_dump(mode="json"),
@@ -40,17 +61,40 @@ class LedgerService:
             subfolder=subfolder,
         )
 
-        self._in_memory.append(entry)
-        logger.info(
-            "Ledger entry recorded id=%s theme=%s lens=%s",
-            entry.id,
-            entry.theme,
-            entry.lens,
-        )
+        self._remember(entry)
         return entry
 
+    async def log_entries_bulk(
+        self,
+        items: Sequence[Tuple[LedgerEntryCreate, str]],
+        *,
+        actor: str | None = None,
+    ) -> List[LedgerEntryNormalized | BaseException]:
+        """
+        Record several `(payload, source)` pairs using Graph JSON batching, so
+        a burst of entries costs one round trip per batch instead of one each.
+
+        Results line up with `items`; a failed upload shows up as its exception
+        instead of aborting the rest of the batch.
+        """
+        entries = [build_ledger_entry(payload, source=source, actor=actor) for payload, source in items]
+        documents = [
+            (entry.model_dump(mode="json"), *self._document_location(entry))
+            for entry in entries
+        ]
+        uploads = await graph_client.upload_json_documents(documents)
+
+        results: List[LedgerEntryNormalized | BaseException] = []
+        for entry, outcome in zip(entries, uploads):
+            if isinstance(outcome, BaseException):
+                results.append(outcome)
+                continue
+            self._remember(entry)
+            results.append(entry)
+        return results
+
     def list_entries(self) -> List[LedgerEntryNormalized]:
-        return sorted(self._in_memory, key=lambda e: e.created_at, reverse=True)
+        return list(self._in_memory)
 
 
 ledger_service = LedgerService()
@@ -1,16 +1,31 @@
-import io
+import asyncio
 import os
 import logging
+import re
+import tempfile
+import time
 import datetime
-from typing import List, Optional
+from collections import deque
+from concurrent.futures import ThreadPoolExecutor
+from contextlib import asynccontextmanager
+from functools import lru_cache
+from pathlib import Path
+from types import MappingProxyType
+from typing import Any, AsyncIterator, Callable, Deque, Dict, Iterable, List, Optional, Tuple, Type, TypeVar
 from urllib.parse import quote
 
-import json
-
+import jinja2
+import orjson
 from fastapi import FastAPI, Form, HTTPException, Request, UploadFile, File, status
-from fastapi.responses import HTMLResponse, RedirectResponse, JSONResponse, StreamingResponse
-from fastapi.staticfiles import StaticFiles
+from fastapi.concurrency import run_in_threadpool
+from fastapi.exceptions import RequestValidationError
+from fastapi.middleware.gzip import GZipMiddleware
+from fastapi.responses import HTMLResponse, ORJSONResponse, RedirectResponse, Response, StreamingResponse
 from fastapi.templating import Jinja2Templates
+from markupsafe import Markup
+from pydantic import BaseModel, ValidationError
+from starlette.background import BackgroundTask
+from starlette.types import ASGIApp, Receive, Scope, Send
 
 from .ledger import ledger_service
 from .schemas import (
@@ -26,26 +41,50 @@ from .schemas import (
     build_ledger_entry,
     build_normalized_entry,
 )
-from .sharepoint_client import graph_client
+from .sharepoint_client import GRAPH_BATCH_MAX, graph_client
 from .todos import todo_service
 from .git_sync import GitError, conflict_files, conflict_markers_preview, fetch, get_status, pull_rebase, push
-from .brands import BrandSpec, list_brands
+from .brands import BrandSpec, list_brand_ids, list_brands
 from .brand_guidelines_samples import (
     list_brand_guidelines_samples,
-    load_brand_guidelines_sample,
-    resolve_static_paths,
+    load_resolved_sample,
 )
 from .collateral_pack import generate_collateral_pack
 from .tools_registry import ToolCreate, ToolRunRequest, ToolRunResult, ToolSpec, tool_registry
 from .tool_store import load_tools, save_tools
+from .static_files import CachedStaticFiles
 
+# The log format doesn't use thread/process fields, so skip collecting them
+# for every record.
+logging.logThreads = False
+logging.logProcesses = False
+logging.logMultiprocessing = False
 logging.basicConfig(
     level=logging.INFO,
     format="%(asctime)s %(levelname)s [%(name)s] %(message)s",
 )
 logger = logging.getLogger("memory_router")
 
-QUICK_LINKS = [
+# Settings are loaded once when the Graph client is constructed and never change
+# afterwards, so resolve the default drive id a single time.
+_DEFAULT_DRIVE_ID = graph_client.settings.drive_id
+
+# Paths are relative to the repo root (the working directory the server runs
+# from); join them once instead of per request.
+STATIC_DIR = os.path.join("app", "static")
+GENERATED_STATIC_DIR = os.path.join(STATIC_DIR, "generated")
+GRAPH_DRIVE_ITEM_PREFIX = f"https://graph.microsoft.com/v1.0/drives/{_DEFAULT_DRIVE_ID}/items/"
+
+def _freeze(value: Any) -> Any:
+    """Recursively turn static page data into read-only tuples / mapping proxies."""
+    if isinstance(value, dict):
+        return MappingProxyType({key: _freeze(item) for key, item in value.items()})
+    if isinstance(value, list):
+        return tuple(_freeze(item) for item in value)
+    return value
+
+
+QUICK_LINKS = _freeze([
     {
         "label": "Memory Router folder",
         "url": "https://vishwaraj04.sharepoint.com/sites/Vishwa/Shared%20Documents/Memory%20Router",
@@ -54,27 +93,19 @@ QUICK_LINKS = [
         "label": "Drive (Vishwa)",
         "url": "https://vishwaraj04.sharepoint.com/sites/Vishwa/Shared%20Documents",
     },
-]
-
-HAPPY_EATS_STORY = """Once Upon a Time in the Lush Countryside of India...
-
-In the heart of a vibrant village surrounded by the verdant splendor of nature, the essence of traditional Indian cuisine thrived. Here, the secret recipes passed down through generations whispered the tales of taste, health, and harmony with nature. From the sun-kissed fields to the bustling kitchen corners, every grain, every spice held a story—a story of the land, a story of life.
+])
 
-This is where "Happy Eats" was born.
+HAPPY_EATS_STORY_PATH = os.path.join(STATIC_DIR, "happy-eats", "story.txt")
 
-The logo of Happy Eats, with its heart cradled by nurturing leaves, is an emblem of love—a love for food that is as pure as a grandmother's hug, as authentic as the earth itself. The heart represents the care we put into selecting the finest organic ingredients, the passion that simmers in our cooking, and the joy that comes from eating well and healthy.
 
-The leaves, verdant and fresh, are a testament to our commitment to freshness. Just like the leaves that protect and nourish the heart of the plant, our sustainable packaging protects the integrity and flavor of our food, ensuring that every bite you take is a whisper of the pure, untainted earth.
+@lru_cache(maxsize=1)
+def happy_eats_story() -> str:
+    """Brand story for /happy-eats, read from disk on first use only."""
+    with open(HAPPY_EATS_STORY_PATH, encoding="utf-8") as f:
+        return f.read().rstrip("\n")
 
-Every curve of the letters in Happy Eats echoes the laughter and conversations that encircle Indian dining tables. They embody the seamless blend of old-world charm and contemporary needs, bringing forth a sense of nostalgia in every crunch of our banana chips, every bite of our multilayered khakhra, and the homely warmth of our thepla.
 
-As you savor the flavors of Happy Eats, you're not just enjoying a snack; you're partaking in a legacy. You're at the crossroads of past and present, where every flavor tells a story, and every meal is a celebration of life's simple pleasures.
-
-So, with every pack of Happy Eats you open, let the aroma transport you to the serene fields, the bustling markets, and the loving kitchens of India. Unwrap a story, take a bite, and let the timeless taste of nostalgia fill your soul with happiness.
-
-...And thus, "Happy Eats" isn't just a brand; it's a journey—a journey of taste that transcends time, bringing the treasures of the past to the table of the present."""
-
-HAPPY_EATS_BRAND_PILLARS = [
+HAPPY_EATS_BRAND_PILLARS = _freeze([
     {
         "title": "100% Handmade with Love",
         "icon": "🤲",
@@ -135,9 +166,9 @@ HAPPY_EATS_BRAND_PILLARS = [
         "description": "FSSAI certified, rigorously tested, consistently excellent.",
         "details": "Every batch meets stringent quality standards, ensuring safety and consistency."
     }
-]
+])
 
-HAPPY_EATS_PRODUCTS = [
+HAPPY_EATS_PRODUCTS = _freeze([
     {
         "name": "Khakhra",
         "packaging": "Hard paper packaging",
@@ -204,157 +235,618 @@ HAPPY_EATS_PRODUCTS = [
         "total_flavors": "1 indulgent flavor",
         "description": "Crunchy peanuts meet creamy mawa—a sweet symphony of textures."
     }
-]
+])
 
-BRAND_ASSETS = [
+HAPPY_EATS_ASSET_CATEGORIES = _freeze([
     {
-        "category": "Packaging Designs",
-        "items": [
-            {"name": "Khakhra - Methi", "file": "khakhra_methi.jpg", "type": "Product Packaging"},
-            {"name": "Khakhra - Chatpata", "file": "khakhra_chatpata.jpg", "type": "Product Packaging"},
-            {"name": "Khakhra - Masala", "file": "khakhra_masala.jpg", "type": "Product Packaging"},
-            {"name": "Khakhra - Jeera", "file": "khakhra_jeera.jpg", "type": "Product Packaging"},
-            {"name": "Khakhra - Farali", "file": "khakhra_farali.jpg", "type": "Product Packaging"},
+        "name": "Packaging Designs",
+        "icon": "📦",
+        "description": "Product packaging designs for all Happy Eats collections",
+        "assets": [
+            {"name": "Khakhra - Methi", "format": "JPG", "description": "Green variant packaging design with illustrated character", "download_url": "/static/happy-eats/packaging/khakhra_methi.jpg", "preview_url": "/static/happy-eats/packaging/khakhra_methi.jpg"},
+            {"name": "Khakhra - Chatpata", "format": "JPG", "description": "Purple variant packaging design with illustrated character", "download_url": "/static/happy-eats/packaging/khakhra_chatpata.jpg", "preview_url": "/static/happy-eats/packaging/khakhra_chatpata.jpg"},
+            {"name": "Khakhra - Masala", "format": "JPG", "description": "Orange variant packaging design with illustrated character", "download_url": "/static/happy-eats/packaging/khakhra_masala.jpg", "preview_url": "/static/happy-eats/packaging/khakhra_masala.jpg"},
+            {"name": "Khakhra - Jeera", "format": "JPG", "description": "Brown variant packaging design with illustrated character", "download_url": "/static/happy-eats/packaging/khakhra_jeera.jpg", "preview_url": "/static/happy-eats/packaging/khakhra_jeera.jpg"},
+            {"name": "Khakhra - Farali", "format": "JPG", "description": "Orange variant packaging design for fasting snacks", "download_url": "/static/happy-eats/packaging/khakhra_farali.jpg", "preview_url": "/static/happy-eats/packaging/khakhra_farali.jpg"},
         ]
     },
     {
-        "category": "Logo & Brand Identity",
-        "items": [
-            {"name": "Happy Eats Logo - Primary", "file": "logo_primary.svg", "type": "Vector Logo"},
-            {"name": "Happy Eats Logo - White", "file": "logo_white.svg", "type": "Vector Logo"},
-            {"name": "Happy Eats Logo - Icon Only", "file": "logo_icon.svg", "type": "Icon"},
-            {"name": "Leaf Heart Symbol", "file": "symbol_leaf_heart.svg", "type": "Brand Mark"},
-            {"name": "100% Handmade Badge", "file": "badge_handmade.svg", "type": "Quality Seal"},
+        "name": "Business Stationery",
+        "icon": "📄",
+        "description": "Professional business cards, letterhead, and email signatures",
+        "assets": [
+            {"name": "Business Card - Front", "format": "HTML", "description": "Print-ready business card front (3.5\" × 2\") with brand colors and logo", "download_url": "/static/happy-eats/collateral/business-card-front.html", "preview_url": "/static/happy-eats/collateral/business-card-front.html"},
+            {"name": "Business Card - Front (Enhanced)", "format": "HTML", "description": "Enhanced version with micro icons and improved layout", "download_url": "/static/happy-eats/collateral/business-card-front-v2.html", "preview_url": "/static/happy-eats/collateral/business-card-front-v2.html"},
+            {"name": "Business Card - Back", "format": "HTML", "description": "Print-ready business card back with contact information", "download_url": "/static/happy-eats/collateral/business-card-back.html", "preview_url": "/static/happy-eats/collateral/business-card-back.html"},
+            {"name": "Business Card - Back (Enhanced)", "format": "HTML", "description": "Enhanced version with better icon alignment and badges", "download_url": "/static/happy-eats/collateral/business-card-back-v2.html", "preview_url": "/static/happy-eats/collateral/business-card-back-v2.html"},
+            {"name": "Letterhead", "format": "HTML", "description": "A4 letterhead template with brand header and footer", "download_url": "/static/happy-eats/collateral/letterhead.html", "preview_url": "/static/happy-eats/collateral/letterhead.html"},
+            {"name": "Letterhead (Enhanced)", "format": "HTML", "description": "Enhanced version with packaging design elements and micro icons", "download_url": "/static/happy-eats/collateral/letterhead-v2.html", "preview_url": "/static/happy-eats/collateral/letterhead-v2.html"},
         ]
     },
     {
-        "category": "Collateral - Business Stationery",
-        "items": [
-            {"name": "Business Card - Front", "file": "/static/happy-eats/collateral/business-card-front.html", "type": "HTML (Print Ready)"},
-            {"name": "Business Card - Back", "file": "/static/happy-eats/collateral/business-card-back.html", "type": "HTML (Print Ready)"},
-            {"name": "Letterhead", "file": "/static/happy-eats/collateral/letterhead.html", "type": "HTML (Print Ready)"},
-            {"name": "Email Signature", "file": "/static/happy-eats/collateral/email-signature.html", "type": "HTML Template"},
+        "name": "Marketing Collateral",
+        "icon": "📢",
+        "description": "Brochures, social media templates, and promotional materials",
+        "assets": [
+            {"name": "Collateral Gallery (All-in-one)", "format": "HTML", "description": "Gallery page to preview and download all collateral files", "download_url": "/static/happy-eats/collateral/index.html", "preview_url": "/static/happy-eats/collateral/index.html"},
+            {"name": "Social Posts Gallery - 11 Posts", "format": "HTML", "description": "Complete gallery with 11 social media post templates across 5 categories", "download_url": "/static/happy-eats/collateral/social-posts/index.html", "preview_url": "/static/happy-eats/collateral/social-posts/index.html"},
+            {"name": "New Year 2026 Post", "format": "HTML", "description": "Seasonal greeting with product packaging (1080×1080px)", "download_url": "/static/happy-eats/collateral/social-posts/new-year-2026.html", "preview_url": "/static/happy-eats/collateral/social-posts/new-year-2026.html"},
+            {"name": "New Year 2026 Generator (5 Styles)", "format": "HTML", "description": "Interactive New Year post generator with 5 exportable styles (PNG download)", "download_url": "/static/happy-eats/collateral/social-posts/new-year-2026-variants.html", "preview_url": "/static/happy-eats/collateral/social-posts/new-year-2026-variants.html"},
+            {"name": "Khakhra Methi Spotlight", "format": "HTML", "description": "Single product variant showcase (1080×1080px)", "download_url": "/static/happy-eats/collateral/social-posts/product-khakhra-methi.html", "preview_url": "/static/happy-eats/collateral/social-posts/product-khakhra-methi.html"},
+            {"name": "Khakhra Collection", "format": "HTML", "description": "4-variant product collection grid (1080×1080px)", "download_url": "/static/happy-eats/collateral/social-posts/product-collection.html", "preview_url": "/static/happy-eats/collateral/social-posts/product-collection.html"},
+            {"name": "Brand Values Post", "format": "HTML", "description": "4-pillar brand values showcase (1080×1080px)", "download_url": "/static/happy-eats/collateral/social-posts/brand-values.html", "preview_url": "/static/happy-eats/collateral/social-posts/brand-values.html"},
+            {"name": "Taste the Tradition", "format": "HTML", "description": "Heritage & tradition messaging (1080×1080px)", "download_url": "/static/happy-eats/collateral/social-posts/taste-tradition.html", "preview_url": "/static/happy-eats/collateral/social-posts/taste-tradition.html"},
+            {"name": "Behind the Scenes", "format": "HTML", "description": "3-step traditional process showcase (1080×1080px)", "download_url": "/static/happy-eats/collateral/social-posts/behind-the-scenes.html", "preview_url": "/static/happy-eats/collateral/social-posts/behind-the-scenes.html"},
+            {"name": "Health Benefits", "format": "HTML", "description": "4 key health benefits showcase (1080×1080px)", "download_url": "/static/happy-eats/collateral/social-posts/health-benefits.html", "preview_url": "/static/happy-eats/collateral/social-posts/health-benefits.html"},
+            {"name": "Recipe Ideas", "format": "HTML", "description": "5 ways to enjoy khakhra (1080×1080px)", "download_url": "/static/happy-eats/collateral/social-posts/recipe-ideas.html", "preview_url": "/static/happy-eats/collateral/social-posts/recipe-ideas.html"},
+            {"name": "Customer Testimonial", "format": "HTML", "description": "5-star review showcase (1080×1080px)", "download_url": "/static/happy-eats/collateral/social-posts/testimonial.html", "preview_url": "/static/happy-eats/collateral/social-posts/testimonial.html"},
+            {"name": "Tri-fold Brochure", "format": "HTML", "description": "A4 landscape tri-fold brochure with products and brand story", "download_url": "/static/happy-eats/collateral/brochure.html", "preview_url": "/static/happy-eats/collateral/brochure.html"},
+            {"name": "Collateral Guide", "format": "MD", "description": "Complete guide on using and customizing brand collateral", "download_url": "/static/happy-eats/collateral/README.md", "preview_url": "/static/happy-eats/collateral/README.md"},
         ]
     },
     {
-        "category": "Collateral - Marketing",
-        "items": [
-            {"name": "Brochure - Tri-fold", "file": "/static/happy-eats/collateral/brochure.html", "type": "HTML (Print Ready)"},
-            {"name": "Social Media Post Template", "file": "/static/happy-eats/collateral/social-media-post.html", "type": "HTML (1080x1080)"},
-            {"name": "Collateral Guide", "file": "/static/happy-eats/collateral/README.md", "type": "Documentation"},
-        ]
-    },
-    {
-        "category": "Collateral - Retail & POS",
-        "items": [
-            {"name": "Shelf Talker", "file": "shelf_talker.pdf", "type": "Print Ready"},
-            {"name": "Danglers", "file": "danglers.pdf", "type": "Print Ready"},
-            {"name": "Standee", "file": "standee.pdf", "type": "Print Ready"},
-            {"name": "Window Decal", "file": "window_decal.pdf", "type": "Print Ready"},
-            {"name": "Price Tags", "file": "price_tags.pdf", "type": "Print Ready"},
+        "name": "Logo & Brand Identity",
+        "icon": "🎨",
+        "description": "Logo variations, brand marks, and identity guidelines",
+        "assets": [
+            {"name": "Primary Logo", "format": "PNG", "description": "Primary Happy Eats logo (provided)", "download_url": "/static/happy-eats/brand/logo.png", "preview_url": "/static/happy-eats/brand/logo.png"},
+            {"name": "White Logo", "format": "SVG", "description": "White version for dark backgrounds (coming soon)", "download_url": "#", "preview_url": "#"},
+            {"name": "Leaf Heart Symbol", "format": "SVG", "description": "Standalone brand mark (coming soon)", "download_url": "#", "preview_url": "#"},
         ]
     },
     {
-        "category": "Icons & Badges",
-        "items": [
-            {"name": "No Maida Icon", "file": "icon_no_maida.svg", "type": "SVG Icon"},
-            {"name": "Ready to Eat Icon", "file": "icon_ready_to_eat.svg", "type": "SVG Icon"},
-            {"name": "Cholesterol Free Icon", "file": "icon_cholesterol_free.svg", "type": "SVG Icon"},
-            {"name": "Zero Trans Fat Icon", "file": "icon_zero_trans_fat.svg", "type": "SVG Icon"},
-            {"name": "100% Wheat Flour Badge", "file": "badge_wheat_flour.svg", "type": "SVG Badge"},
+        "name": "Quality Badges",
+        "icon": "✨",
+        "description": "Product quality seals and certification badges",
+        "assets": [
+            {"name": "100% Handmade", "format": "SVG", "description": "Quality badge for handmade products (coming soon)", "download_url": "#", "preview_url": "#"},
+            {"name": "No Maida", "format": "SVG", "description": "Health badge for maida-free products (coming soon)", "download_url": "#", "preview_url": "#"},
+            {"name": "Zero Trans Fat", "format": "SVG", "description": "Health badge for zero trans fat (coming soon)", "download_url": "#", "preview_url": "#"},
+            {"name": "Cholesterol Free", "format": "SVG", "description": "Health badge for cholesterol-free products (coming soon)", "download_url": "#", "preview_url": "#"},
         ]
     }
-]
+])
+
+# Each match is already trimmed, so callers never strip twice or build an
+# intermediate list of raw lines/parts.
+_LINE_RE = re.compile(r"\S(?:[^\r\n]*\S)?")
+_CSV_RE = re.compile(r"[^,\s](?:[^,]*[^,\s])?")
+
+
+def _split_lines(raw: Optional[str]) -> List[str]:
+    return _LINE_RE.findall(raw) if raw else []
+
+
+def _split_csv(raw: Optional[str]) -> List[str]:
+    return _CSV_RE.findall(raw) if raw else []
+
+
+@lru_cache(maxsize=None)
+def _enum_index(enum_cls) -> Dict[str, Any]:
+    return {member.value.lower(): member for member in enum_cls}
+
 
 def _parse_enum_list(raw: Optional[str], enum_cls):
     values: List = []
     if not raw:
         return values
-    for part in raw.split(","):
-        cleaned = part.strip().lstrip("#").split("/")[-1]
+    index = _enum_index(enum_cls)
+    for part in _CSV_RE.findall(raw):
+        cleaned = part.lstrip("#").rpartition("/")[2]
         if not cleaned:
             continue
-        for enum_member in enum_cls:
-            if cleaned.lower() == enum_member.value.lower():
-                values.append(enum_member)
-                break
+        member = index.get(cleaned.lower())
+        if member is not None:
+            values.append(member)
     return values
 
 
+LEDGER_SUMMARY_MAX = 240
+
+
+def _truncate(text: str, limit: int) -> str:
+    # Only slice (and allocate) when the text is actually over the limit.
+    return text[:limit] if len(text) > limit else text
+
+
+@lru_cache(maxsize=64)
+def _see_other_headers(url: str) -> tuple[tuple[bytes, bytes], ...]:
+    return tuple(RedirectResponse(url=url, status_code=status.HTTP_303_SEE_OTHER).raw_headers)
+
+
+def _see_other(url: str) -> Response:
+    """303 redirect whose (quoted, encoded) headers are built once per target URL."""
+    response = Response(status_code=status.HTTP_303_SEE_OTHER)
+    response.raw_headers = list(_see_other_headers(url))
+    return response
+
+
+def _form_submit_response(request: Request, url: str) -> Response:
+    """
+    Redirect classic form posts (PRG); fetch/XHR callers get a bare 204 so they
+    don't pay for a follow-up GET and full page render they will never show.
+    """
+    if (
+        request.headers.get("x-requested-with") == "XMLHttpRequest"
+        or "application/json" in request.headers.get("accept", "")
+    ):
+        return Response(status_code=status.HTTP_204_NO_CONTENT)
+    return _see_other(url)
+
+
+ModelT = TypeVar("ModelT", bound=BaseModel)
+
+
+async def _read_json_body(request: Request, model_cls: Type[ModelT]) -> ModelT:
+    """
+    Parse and validate a JSON body in a single pass (pydantic's jiter path).
+
+    Errors are re-raised as RequestValidationError so clients still get the
+    usual FastAPI 422 payload with `body`-prefixed locations.
+    """
+    try:
+        return model_cls.model_validate_json(await request.body())
+    except ValidationError as exc:
+        raise RequestValidationError(
+            [{**err, "loc": ("body", *err["loc"])} for err in exc.errors(include_url=False)]
+        ) from exc
+
+
+def _json_body_openapi(model_cls: Type[BaseModel]) -> Dict[str, Any]:
+    """Describe a manually parsed JSON body so /docs still shows the schema."""
+    schema = model_cls.model_json_schema(ref_template="#/components/schemas/{model}")
+    schema.pop("$defs", None)
+    return {
+        "requestBody": {
+            "required": True,
+            "content": {"application/json": {"schema": schema}},
+        }
+    }
+
+
+# Payloads assembled from values that are already typed (Form(...) fields,
+# parsed enum lists, normalized entries) use `model_construct`, skipping a
+# second pydantic validation pass on the request path.
+def _ledger_payload_for_entry(entry: EntryNormalized, *, item_id: str) -> LedgerEntryCreate:
+    summary = _truncate(entry.content_normalized or entry.content_raw, LEDGER_SUMMARY_MAX)
+    artifact_tag = ArtifactType.NOTE if entry.category == EntryCategory.NOTE else ArtifactType.WORKFLOW_DECISION
+    return LedgerEntryCreate.model_construct(
+        title=f"{entry.category.value.title()} entry captured",
+        summary=summary,
+        theme="Workflow",
+        lens="MemoryRouter",
+        project=entry.project,
+        value_tags=[ValueTag.GROWTH, ValueTag.EFFICIENCY],
+        artifact_tags=[artifact_tag],
+        references=[GRAPH_DRIVE_ITEM_PREFIX + item_id],
+    )
+
+
+# Ledger records for accepted entries are written in the background so the
+# request only waits for the entry upload itself. The consumer drains whatever
+# has piled up (up to one Graph JSON batch) and records it in a single call.
+LEDGER_QUEUE_MAX = 1024
+LEDGER_BATCH_MAX = GRAPH_BATCH_MAX
+LEDGER_DRAIN_TIMEOUT_S = 10.0
+
+# (entry id, ledger payload, source)
+_LedgerJob = tuple[str, LedgerEntryCreate, str]
+_ledger_queue: Optional["asyncio.Queue[_LedgerJob]"] = None
+
+
+async def _ledger_consumer(queue: "asyncio.Queue[_LedgerJob]") -> None:
+    while True:
+        batch = [await queue.get()]
+        while len(batch) < LEDGER_BATCH_MAX and not queue.empty():
+            batch.append(queue.get_nowait())
+        try:
+            results = await ledger_service.log_entries_bulk(
+                [(payload, source) for _, payload, source in batch],
+                actor="memory-router",
+            )
+            for (entry_id, _, _), result in zip(batch, results):
+                if isinstance(result, BaseException):
+                    logger.warning("Failed to log ledger entry for %s: %s", entry_id, result)
+        except Exception as exc:  # pragma: no cover - keep the consumer alive
+            logger.warning("Ledger batch of %d failed: %s", len(batch), exc)
+        finally:
+            for _ in batch:
+                queue.task_done()
+
+
 async def _record_ledger_for_entry(
     entry: EntryNormalized,
     *,
     item_id: str,
     source: str,
 ) -> None:
-    summary = entry.content_normalized[:240] or entry.content_raw[:240]
-    artifact_tag = ArtifactType.NOTE if entry.category == EntryCategory.NOTE else ArtifactType.WORKFLOW_DECISION
+    payload = _ledger_payload_for_entry(entry, item_id=item_id)
+    if _ledger_queue is not None:
+        try:
+            _ledger_queue.put_nowait((entry.id, payload, source))
+            return
+        except asyncio.QueueFull:
+            logger.warning("Ledger queue full; recording entry %s inline", entry.id)
+
+    # No consumer running (or backpressure): record on the request path.
     try:
-        await ledger_service.log_entry(
-            LedgerEntryCreate(
-                title=f"{entry.category.value.title()} entry captured",
-                summary=summary,
-                theme="Workflow",
-                lens="MemoryRouter",
-                project=entry.project,
-                value_tags=[ValueTag.GROWTH, ValueTag.EFFICIENCY],
-                artifact_tags=[artifact_tag],
-                references=[
-                    f"https://graph.microsoft.com/v1.0/drives/{graph_client.settings.drive_id}/items/{item_id}"
-                ],
-            ),
-            source=source,
-            actor="memory-router",
-        )
+        await ledger_service.log_entry(payload, source=source, actor="memory-router")
     except Exception as exc:
         logger.warning("Failed to log ledger entry for %s: %s", entry.id, exc)
 
-app = FastAPI(title="Memory Router", version="0.1.0")
+
+# Tool edits only mark the registry dirty; a single flusher writes the whole
+# registry at most once per delay window, so bulk edits cost one disk write.
+TOOLS_FLUSH_DELAY_S = 0.2
+_tools_dirty: Optional[asyncio.Event] = None
+# The save currently running in the threadpool; shutdown waits for it.
+_tools_save: Optional["asyncio.Future[None]"] = None
+
+
+async def _tools_flusher(dirty: asyncio.Event) -> None:
+    global _tools_save
+    while True:
+        await dirty.wait()
+        await asyncio.sleep(TOOLS_FLUSH_DELAY_S)
+        # Cleared before the snapshot is taken so edits made during the write
+        # mark the registry dirty again; a failed save re-marks it below.
+        dirty.clear()
+        _tools_save = asyncio.ensure_future(run_in_threadpool(save_tools))
+        try:
+            # Shielded: cancelling the flusher must not abandon a write in progress.
+            await asyncio.shield(_tools_save)
+        except asyncio.CancelledError:
+            raise
+        except Exception as exc:  # pragma: no cover - keep the flusher alive
+            dirty.set()
+            logger.warning("Failed to save tools: %s", exc)
+
+
+def _mark_tools_dirty() -> None:
+    if _tools_dirty is not None:
+        _tools_dirty.set()
+        return
+    # No flusher running (e.g. outside the app lifespan): write straight away.
+    save_tools()
+
+
+# /health serves the last Graph probe instead of calling Graph per request, so
+# load-balancer probe rate is decoupled from Graph latency. The result is
+# stored as (checked_at, outcome) so a stale one (no background loop, or a
+# stuck loop) is re-probed on demand.
+HEALTH_PROBE_INTERVAL_S = 15.0
+HEALTH_MAX_AGE_S = 2 * HEALTH_PROBE_INTERVAL_S
+_health: Optional[Tuple[float, Dict[str, str]]] = None
+
+
+async def _probe_health() -> Dict[str, str]:
+    global _health
+    graph_ok = False
+    try:
+        graph_ok = await graph_client.health_check()
+    except Exception:
+        graph_ok = False
+
+    outcome = {
+        "status": "ok" if graph_ok else "degraded",
+        "graph": "ok" if graph_ok else "unreachable",
+    }
+    if _health is None or outcome != _health[1]:
+        logger.info("Health check result: %s", outcome)
+    _health = (time.monotonic(), outcome)
+    return outcome
+
+
+async def _health_loop() -> None:
+    while True:
+        await _probe_health()
+        await asyncio.sleep(HEALTH_PROBE_INTERVAL_S)
+
+
+@asynccontextmanager
+async def lifespan(_: FastAPI) -> AsyncIterator[None]:
+    global _ledger_queue, _tools_dirty, _tools_save, _tool_executor
+    _tool_executor = _new_tool_executor()
+    _ledger_queue = asyncio.Queue(maxsize=LEDGER_QUEUE_MAX)
+    consumer = asyncio.create_task(_ledger_consumer(_ledger_queue))
+    _tools_dirty = asyncio.Event()
+    flusher = asyncio.create_task(_tools_flusher(_tools_dirty))
+    health_probe = asyncio.create_task(_health_loop())
+    try:
+        yield
+    finally:
+        health_probe.cancel()
+
+        # Let an in-flight tools write finish, then flush anything still pending.
+        flusher.cancel()
+        await asyncio.gather(flusher, return_exceptions=True)
+        if _tools_save is not None:
+            (outcome,) = await asyncio.gather(_tools_save, return_exceptions=True)
+            if isinstance(outcome, BaseException):
+                _tools_dirty.set()
+            _tools_save = None
+        if _tools_dirty.is_set():
+            save_tools()
+        _tools_dirty = None
+
+        # Give pending ledger writes a chance to land before shutting down.
+        try:
+            await asyncio.wait_for(_ledger_queue.join(), timeout=LEDGER_DRAIN_TIMEOUT_S)
+        except asyncio.TimeoutError:
+            logger.warning("Dropping %d pending ledger entries on shutdown", _ledger_queue.qsize())
+        consumer.cancel()
+        _ledger_queue = None
+        _tool_executor.shutdown(wait=False, cancel_futures=True)
+        _tool_executor = None
+
+
+app = FastAPI(
+    title="Memory Router",
+    version="0.1.0",
+    default_response_class=ORJSONResponse,
+    lifespan=lifespan,
+)
+
+# Paths whose bodies are already compressed (images, favicon), precompressed
+# (.gz siblings of static text assets, see scripts/precompress_static.py) or
+# streamed binaries that should keep their Content-Length.
+_NO_GZIP_PREFIXES = ("/static/", "/favicon.ico", "/drive/download/")
+
+
+class _DynamicGZipMiddleware:
+    """Gzip the app's own HTML/JSON responses; pass everything under `_NO_GZIP_PREFIXES` through."""
+
+    def __init__(self, app: ASGIApp, minimum_size: int = 500) -> None:
+        self.app = app
+        self.gzip = GZipMiddleware(app, minimum_size=minimum_size)
+
+    async def __call__(self, scope: Scope, receive: Receive, send: Send) -> None:
+        if scope["type"] == "http" and not scope["path"].startswith(_NO_GZIP_PREFIXES):
+            await self.gzip(scope, receive, send)
+        else:
+            await self.app(scope, receive, send)
+
+
+app.add_middleware(_DynamicGZipMiddleware, minimum_size=500)
 
 # Static assets (favicon, etc.)
-app.mount("/static", StaticFiles(directory=os.path.join("app", "static")), name="static")
+app.mount("/static", CachedStaticFiles(directory=STATIC_DIR), name="static")
+
+
+FAVICON_PATH = os.path.join(STATIC_DIR, "favicon.ico")
+FAVICON_CACHE_CONTROL = "public, max-age=604800, immutable"
+
+
+@lru_cache(maxsize=1)
+def _favicon_bytes() -> bytes:
+    with open(FAVICON_PATH, "rb") as f:
+        return f.read()
 
 
 @app.get("/favicon.ico", include_in_schema=False)
-async def favicon_redirect() -> RedirectResponse:
-    # Many browsers request /favicon.ico by default.
-    return RedirectResponse(url="/static/favicon.ico", status_code=status.HTTP_307_TEMPORARY_REDIRECT)
+def favicon() -> Response:
+    # Many browsers request /favicon.ico by default. Serve it directly (no
+    # redirect round trip) and let them keep it for a week. A missing file is a
+    # 404, as the old redirect to /static gave; lru_cache does not cache the
+    # error, so a favicon added later is picked up.
+    try:
+        content = _favicon_bytes()
+    except FileNotFoundError:
+        raise HTTPException(status_code=status.HTTP_404_NOT_FOUND, detail="Not Found")
+    return Response(
+        content=content,
+        media_type="image/x-icon",
+        headers={"Cache-Control": FAVICON_CACHE_CONTROL},
+    )
+
+# Compiled template bytecode is persisted here so a fresh worker skips the
+# lex/parse/codegen step. Jinja never evicts these files, so we trim on boot.
+JINJA_CACHE_DIR = os.path.join(".memory_router", "jinja_cache")
+JINJA_CACHE_MAX_FILES = 200
+
+
+def _trim_jinja_cache(directory: str, max_files: int) -> None:
+    try:
+        entries = [e for e in os.scandir(directory) if e.is_file() and e.name.endswith(".cache")]
+    except OSError:
+        return
+    if len(entries) <= max_files:
+        return
+    entries.sort(key=lambda e: e.stat().st_mtime, reverse=True)
+    for stale in entries[max_files:]:
+        try:
+            os.remove(stale.path)
+        except OSError:
+            pass
+
+
+os.makedirs(JINJA_CACHE_DIR, exist_ok=True)
+_trim_jinja_cache(JINJA_CACHE_DIR, JINJA_CACHE_MAX_FILES)
+
+# Templates only change on deploy: keep every compiled template in memory
+# (unbounded cache, no mtime checks) and compile them all up front so the first
+# request to each page doesn't pay for parsing.
+templates = Jinja2Templates(
+    env=jinja2.Environment(
+        loader=jinja2.FileSystemLoader("app/templates"),
+        autoescape=True,
+        auto_reload=False,
+        cache_size=-1,
+        bytecode_cache=jinja2.FileSystemBytecodeCache(directory=JINJA_CACHE_DIR, pattern="%s.cache"),
+    )
+)
+for _template_name in templates.env.list_templates(extensions=["html"]):
+    templates.env.get_template(_template_name)
+
+# The quick links never change at runtime, so render that fragment once and
+# inject the resulting HTML instead of re-running the loop on every `/` hit.
+QUICK_LINKS_HTML = Markup(templates.env.get_template("quick_links.html").render(quick_links=QUICK_LINKS))
 
-templates = Jinja2Templates(directory="app/templates")
 
+LOGO_MAX_BYTES = 5 * 1024 * 1024
+# Each chunk costs one thread-pool hop to read (once spooled to disk) and one to
+# write, so use large chunks: a max-size logo is at most ~10 hops.
+UPLOAD_CHUNK_SIZE = 1024 * 1024
 
-def _happy_eats_logo_path() -> str:
-    return os.path.join("app", "static", "happy-eats", "brand", "logo.png")
+
+HAPPY_EATS_LOGO_PATH = os.path.join(STATIC_DIR, "happy-eats", "brand", "logo.png")
+HAPPY_EATS_LOGO_DIR = os.path.dirname(HAPPY_EATS_LOGO_PATH)
+
+
+def _open_logo_upload() -> Tuple[Any, str]:
+    # A unique temp file per request, next to the logo so os.replace stays on one
+    # filesystem; concurrent uploads never share (or delete) each other's file.
+    fd, path = tempfile.mkstemp(dir=HAPPY_EATS_LOGO_DIR, suffix=".upload")
+    os.chmod(path, 0o644)  # mkstemp creates 0600; the installed logo must stay world-readable
+    return os.fdopen(fd, "wb"), path
+
+
+def _discard_logo_upload(out: Any, path: str) -> None:
+    out.close()
+    try:
+        os.remove(path)
+    except OSError:
+        pass
+
+
+# (checked_at, present) from the last stat; re-checked after the TTL expires and
+# reset whenever a new logo is uploaded.
+LOGO_PRESENCE_TTL_S = 5.0
+_logo_presence: Optional[tuple[float, bool]] = None
 
 
 def _happy_eats_logo_is_present() -> bool:
+    global _logo_presence
+    now = time.monotonic()
+    if _logo_presence is not None and now - _logo_presence[0] < LOGO_PRESENCE_TTL_S:
+        return _logo_presence[1]
     try:
-        return os.path.getsize(_happy_eats_logo_path()) > 0
+        present = os.path.getsize(HAPPY_EATS_LOGO_PATH) > 0
     except OSError:
-        return False
+        present = False
+    _logo_presence = (now, present)
+    return present
+
+
+def _invalidate_logo_presence() -> None:
+    global _logo_presence
+    _logo_presence = None
+
+
+# brand -> (checked_at, exists) for the generated collateral index. Keys are
+# validated brand ids, so the dict stays as small as the brand list.
+COLLATERAL_EXISTS_TTL_S = 5.0
+_collateral_exists: Dict[str, tuple[float, bool]] = {}
+
+
+async def _generated_collateral_exists(brand_id: str) -> bool:
+    now = time.monotonic()
+    cached = _collateral_exists.get(brand_id)
+    if cached is not None and now - cached[0] < COLLATERAL_EXISTS_TTL_S:
+        return cached[1]
+    index_path = os.path.join(GENERATED_STATIC_DIR, brand_id, "collateral", "index.html")
+    exists = await run_in_threadpool(os.path.exists, index_path)
+    _collateral_exists[brand_id] = (now, exists)
+    return exists
 
 # Load locally persisted tools on startup (safe default). If the store is missing,
 # we still have the seeded example tool.
 load_tools()
 
-# In-memory session view of accepted entries (not a database).
-IN_MEMORY_ENTRIES: List[EntryNormalized] = []
+# Tool entrypoints are arbitrary sync callables (CPU, disk, subprocess), so they
+# run on their own bounded pool rather than the event loop or the shared
+# threadpool used by sync handlers. The pool lives for one app lifespan.
+_tool_executor: Optional[ThreadPoolExecutor] = None
+
+
+def _new_tool_executor() -> ThreadPoolExecutor:
+    return ThreadPoolExecutor(
+        max_workers=graph_client.settings.tool_workers,
+        thread_name_prefix="tool",
+    )
+
+
+async def _run_tool(tool_id: str, payload: ToolRunRequest) -> ToolRunResult:
+    loop = asyncio.get_running_loop()
+    # Outside the lifespan (no pool yet) fall back to the loop's default executor.
+    return await loop.run_in_executor(_tool_executor, tool_registry.run, tool_id, payload)
+
+# In-memory session view of accepted entries (not a database). Bounded so a
+# long-running process keeps only the most recent entries; appends happen in
+# acceptance order, so newest-first is just the reversed deque.
+IN_MEMORY_ENTRIES_MAX = 500
+IN_MEMORY_ENTRIES: Deque[EntryNormalized] = deque(maxlen=IN_MEMORY_ENTRIES_MAX)
+_entries_version = 0
+
+
+def _remember_entry(entry: EntryNormalized) -> None:
+    global _entries_version
+    IN_MEMORY_ENTRIES.append(entry)
+    _entries_version += 1
+
+
+# List endpoints answer conditional GETs from a per-list version counter. The
+# epoch keeps ETags from a previous process from matching after a restart.
+_ETAG_EPOCH = format(time.time_ns(), "x")
+_LIST_CACHE_CONTROL = "private, must-revalidate"
+
+
+def _list_etag(name: str, version: int) -> str:
+    return f'W/"{name}-{_ETAG_EPOCH}-{version}"'
+
+
+def _list_validators(name: str, version: int) -> Dict[str, str]:
+    return {"ETag": _list_etag(name, version), "Cache-Control": _LIST_CACHE_CONTROL}
+
+
+def _not_modified(request: Request, headers: Dict[str, str]) -> Optional[Response]:
+    """Return a bodiless 304 if the client already holds `headers["ETag"]`."""
+    if_none_match = request.headers.get("if-none-match")
+    if if_none_match and headers["ETag"] in (tag.strip() for tag in if_none_match.split(",")):
+        return Response(status_code=status.HTTP_304_NOT_MODIFIED, headers=headers)
+    return None
+
+
+# Serialized list bodies keyed by list name, reused until its version moves.
+_list_body_cache: Dict[str, Tuple[int, bytes]] = {}
+
+
+def _list_response(
+    request: Request, name: str, version: int, items: Callable[[], Iterable[BaseModel]]
+) -> Response:
+    """
+    Serve a list endpoint straight from `model_dump` + orjson, skipping the
+    response-model re-validation; answers 304 if the client has this version.
+    """
+    headers = _list_validators(name, version)
+    cached = _not_modified(request, headers)
+    if cached is not None:
+        return cached
+
+    cached = _list_body_cache.get(name)
+    if cached is None or cached[0] != version:
+        cached = (version, orjson.dumps([item.model_dump(mode="json") for item in items()]))
+        _list_body_cache[name] = cached
+    return Response(content=cached[1], media_type="application/json", headers=headers)
+
+
+# This file lives in <repo>/app/main.py
+_REPO_ROOT = str(Path(__file__).resolve().parents[1])
 
 
 def _repo_root() -> str:
-    # This file lives in <repo>/app/main.py
-    return str(__import__("pathlib").Path(__file__).resolve().parents[1])
+    return _REPO_ROOT
 
 
 @app.get("/", response_class=HTMLResponse)
-async def index(request: Request) -> HTMLResponse:
+def index(request: Request) -> HTMLResponse:
     todos = todo_service.list_entries()
     ledger_entries = ledger_service.list_entries()[:5]
     return templates.TemplateResponse(
         "index.html",
         {
             "request": request,
-            "quick_links": QUICK_LINKS,
+            "quick_links_html": QUICK_LINKS_HTML,
             "todos": todos,
             "recent_ledger": ledger_entries,
         },
@@ -362,20 +854,20 @@ async def index(request: Request) -> HTMLResponse:
 
 
 @app.get("/happy-eats", response_class=HTMLResponse)
-async def happy_eats_page(request: Request) -> HTMLResponse:
+def happy_eats_page(request: Request) -> HTMLResponse:
     """Happy Eats brand landing page"""
     return templates.TemplateResponse(
         "happy_eats.html",
         {
             "request": request,
             "products": HAPPY_EATS_PRODUCTS,
-            "story": HAPPY_EATS_STORY,
+            "story": happy_eats_story(),
         },
     )
 
 
 @app.get("/happy-eats/brand-pillars", response_class=HTMLResponse)
-async def happy_eats_brand_pillars(request: Request) -> HTMLResponse:
+def happy_eats_brand_pillars(request: Request) -> HTMLResponse:
     """Happy Eats brand pillars detail page"""
     return templates.TemplateResponse(
         "happy_eats_pillars.html",
@@ -387,92 +879,24 @@ async def happy_eats_brand_pillars(request: Request) -> HTMLResponse:
 
 
 @app.get("/happy-eats/brand-assets", response_class=HTMLResponse)
-async def happy_eats_brand_assets(request: Request) -> HTMLResponse:
+def happy_eats_brand_assets() -> HTMLResponse:
     """Happy Eats brand assets library"""
-    # Transform BRAND_ASSETS into the format expected by template
-    asset_categories = [
-        {
-            "name": "Packaging Designs",
-            "icon": "📦",
-            "description": "Product packaging designs for all Happy Eats collections",
-            "assets": [
-                {"name": "Khakhra - Methi", "format": "JPG", "description": "Green variant packaging design with illustrated character", "download_url": "/static/happy-eats/packaging/khakhra_methi.jpg", "preview_url": "/static/happy-eats/packaging/khakhra_methi.jpg"},
-                {"name": "Khakhra - Chatpata", "format": "JPG", "description": "Purple variant packaging design with illustrated character", "download_url": "/static/happy-eats/packaging/khakhra_chatpata.jpg", "preview_url": "/static/happy-eats/packaging/khakhra_chatpata.jpg"},
-                {"name": "Khakhra - Masala", "format": "JPG", "description": "Orange variant packaging design with illustrated character", "download_url": "/static/happy-eats/packaging/khakhra_masala.jpg", "preview_url": "/static/happy-eats/packaging/khakhra_masala.jpg"},
-                {"name": "Khakhra - Jeera", "format": "JPG", "description": "Brown variant packaging design with illustrated character", "download_url": "/static/happy-eats/packaging/khakhra_jeera.jpg", "preview_url": "/static/happy-eats/packaging/khakhra_jeera.jpg"},
-                {"name": "Khakhra - Farali", "format": "JPG", "description": "Orange variant packaging design for fasting snacks", "download_url": "/static/happy-eats/packaging/khakhra_farali.jpg", "preview_url": "/static/happy-eats/packaging/khakhra_farali.jpg"},
-            ]
-        },
-        {
-            "name": "Business Stationery",
-            "icon": "📄",
-            "description": "Professional business cards, letterhead, and email signatures",
-            "assets": [
-                {"name": "Business Card - Front", "format": "HTML", "description": "Print-ready business card front (3.5\" × 2\") with brand colors and logo", "download_url": "/static/happy-eats/collateral/business-card-front.html", "preview_url": "/static/happy-eats/collateral/business-card-front.html"},
-                {"name": "Business Card - Front (Enhanced)", "format": "HTML", "description": "Enhanced version with micro icons and improved layout", "download_url": "/static/happy-eats/collateral/business-card-front-v2.html", "preview_url": "/static/happy-eats/collateral/business-card-front-v2.html"},
-                {"name": "Business Card - Back", "format": "HTML", "description": "Print-ready business card back with contact information", "download_url": "/static/happy-eats/collateral/business-card-back.html", "preview_url": "/static/happy-eats/collateral/business-card-back.html"},
-                {"name": "Business Card - Back (Enhanced)", "format": "HTML", "description": "Enhanced version with better icon alignment and badges", "download_url": "/static/happy-eats/collateral/business-card-back-v2.html", "preview_url": "/static/happy-eats/collateral/business-card-back-v2.html"},
-                {"name": "Letterhead", "format": "HTML", "description": "A4 letterhead template with brand header and footer", "download_url": "/static/happy-eats/collateral/letterhead.html", "preview_url": "/static/happy-eats/collateral/letterhead.html"},
-                {"name": "Letterhead (Enhanced)", "format": "HTML", "description": "Enhanced version with packaging design elements and micro icons", "download_url": "/static/happy-eats/collateral/letterhead-v2.html", "preview_url": "/static/happy-eats/collateral/letterhead-v2.html"},
-        {
-            "name": "Marketing Collateral",
-            "icon": "📢",
-            "description": "Brochures, social media templates, and promotional materials",
-            "assets": [
-                {"name": "Collateral Gallery (All-in-one)", "format": "HTML", "description": "Gallery page to preview and download all collateral files", "download_url": "/static/happy-eats/collateral/index.html", "preview_url": "/static/happy-eats/collateral/index.html"},
-                {"name": "Social Posts Gallery - 11 Posts", "format": "HTML", "description": "Complete gallery with 11 social media post templates across 5 categories", "download_url": "/static/happy-eats/collateral/social-posts/index.html", "preview_url": "/static/happy-eats/collateral/social-posts/index.html"},
-                {"name": "New Year 2026 Post", "format": "HTML", "description": "Seasonal greeting with product packaging (1080×1080px)", "download_url": "/static/happy-eats/collateral/social-posts/new-year-2026.html", "preview_url": "/static/happy-eats/collateral/social-posts/new-year-2026.html"},
-                {"name": "New Year 2026 Generator (5 Styles)", "format": "HTML", "description": "Interactive New Year post generator with 5 exportable styles (PNG download)", "download_url": "/static/happy-eats/collateral/social-posts/new-year-2026-variants.html", "preview_url": "/static/happy-eats/collateral/social-posts/new-year-2026-variants.html"},
-                {"name": "Khakhra Methi Spotlight", "format": "HTML", "description": "Single product variant showcase (1080×1080px)", "download_url": "/static/happy-eats/collateral/social-posts/product-khakhra-methi.html", "preview_url": "/static/happy-eats/collateral/social-posts/product-khakhra-methi.html"},
-                {"name": "Khakhra Collection", "format": "HTML", "description": "4-variant product collection grid (1080×1080px)", "download_url": "/static/happy-eats/collateral/social-posts/product-collection.html", "preview_url": "/static/happy-eats/collateral/social-posts/product-collection.html"},
-                {"name": "Brand Values Post", "format": "HTML", "description": "4-pillar brand values showcase (1080×1080px)", "download_url": "/static/happy-eats/collateral/social-posts/brand-values.html", "preview_url": "/static/happy-eats/collateral/social-posts/brand-values.html"},
-                {"name": "Taste the Tradition", "format": "HTML", "description": "Heritage & tradition messaging (1080×1080px)", "download_url": "/static/happy-eats/collateral/social-posts/taste-tradition.html", "preview_url": "/static/happy-eats/collateral/social-posts/taste-tradition.html"},
-                {"name": "Behind the Scenes", "format": "HTML", "description": "3-step traditional process showcase (1080×1080px)", "download_url": "/static/happy-eats/collateral/social-posts/behind-the-scenes.html", "preview_url": "/static/happy-eats/collateral/social-posts/behind-the-scenes.html"},
-                {"name": "Health Benefits", "format": "HTML", "description": "4 key health benefits showcase (1080×1080px)", "download_url": "/static/happy-eats/collateral/social-posts/health-benefits.html", "preview_url": "/static/happy-eats/collateral/social-posts/health-benefits.html"},
-                {"name": "Recipe Ideas", "format": "HTML", "description": "5 ways to enjoy khakhra (1080×1080px)", "download_url": "/static/happy-eats/collateral/social-posts/recipe-ideas.html", "preview_url": "/static/happy-eats/collateral/social-posts/recipe-ideas.html"},
-                {"name": "Customer Testimonial", "format": "HTML", "description": "5-star review showcase (1080×1080px)", "download_url": "/static/happy-eats/collateral/social-posts/testimonial.html", "preview_url": "/static/happy-eats/collateral/social-posts/testimonial.html"},
-                {"name": "Tri-fold Brochure", "format": "HTML", "description": "A4 landscape tri-fold brochure with products and brand story", "download_url": "/static/happy-eats/collateral/brochure.html", "preview_url": "/static/happy-eats/collateral/brochure.html"},
-                {"name": "Collateral Guide", "format": "MD", "description": "Complete guide on using and customizing brand collateral", "download_url": "/static/happy-eats/collateral/README.md", "preview_url": "/static/happy-eats/collateral/README.md"},
-            ]
-        },      {"name": "Tri-fold Brochure", "format": "HTML", "description": "A4 landscape tri-fold brochure with products and brand story", "download_url": "/static/happy-eats/collateral/brochure.html", "preview_url": "/static/happy-eats/collateral/brochure.html"},
-                {"name": "Collateral Guide", "format": "MD", "description": "Complete guide on using and customizing brand collateral", "download_url": "/static/happy-eats/collateral/README.md", "preview_url": "/static/happy-eats/collateral/README.md"},
-            ]
-        },
-        {
-            "name": "Logo & Brand Identity",
-            "icon": "🎨",
-            "description": "Logo variations, brand marks, and identity guidelines",
-            "assets": [
-                {"name": "Primary Logo", "format": "PNG", "description": "Primary Happy Eats logo (provided)", "download_url": "/static/happy-eats/brand/logo.png", "preview_url": "/static/happy-eats/brand/logo.png"},
-                {"name": "White Logo", "format": "SVG", "description": "White version for dark backgrounds (coming soon)", "download_url": "#", "preview_url": "#"},
-                {"name": "Leaf Heart Symbol", "format": "SVG", "description": "Standalone brand mark (coming soon)", "download_url": "#", "preview_url": "#"},
-            ]
-        },
-        {
-            "name": "Quality Badges",
-            "icon": "✨",
-            "description": "Product quality seals and certification badges",
-            "assets": [
-                {"name": "100% Handmade", "format": "SVG", "description": "Quality badge for handmade products (coming soon)", "download_url": "#", "preview_url": "#"},
-                {"name": "No Maida", "format": "SVG", "description": "Health badge for maida-free products (coming soon)", "download_url": "#", "preview_url": "#"},
-                {"name": "Zero Trans Fat", "format": "SVG", "description": "Health badge for zero trans fat (coming soon)", "download_url": "#", "preview_url": "#"},
-                {"name": "Cholesterol Free", "format": "SVG", "description": "Health badge for cholesterol-free products (coming soon)", "download_url": "#", "preview_url": "#"},
-            ]
-        }
-    ]
+    return HTMLResponse(content=_happy_eats_brand_assets_page(_happy_eats_logo_is_present()))
 
-    return templates.TemplateResponse(
-        "happy_eats_assets.html",
-        {
-            "request": request,
-            "asset_categories": asset_categories,
-            "happy_eats_logo_present": _happy_eats_logo_is_present(),
-        },
+
+@lru_cache(maxsize=2)
+def _happy_eats_brand_assets_page(logo_present: bool) -> bytes:
+    # The page depends only on the frozen catalogue and whether the logo exists,
+    # so each of the two variants is rendered once and then served as bytes.
+    html = templates.get_template("happy_eats_assets.html").render(
+        asset_categories=HAPPY_EATS_ASSET_CATEGORIES,
+        happy_eats_logo_present=logo_present,
     )
+    return html.encode("utf-8")
 
 
 @app.get("/happy-eats/brand-logo", response_class=HTMLResponse)
-async def happy_eats_brand_logo(request: Request) -> HTMLResponse:
+def happy_eats_brand_logo(request: Request) -> HTMLResponse:
     """Upload/replace the Happy Eats logo used by collateral templates."""
     return templates.TemplateResponse(
         "happy_eats_logo_upload.html",
@@ -485,7 +909,7 @@ async def happy_eats_brand_logo(request: Request) -> HTMLResponse:
 
 
 @app.post("/happy-eats/brand-logo")
-async def happy_eats_brand_logo_upload(file: UploadFile = File(...)) -> RedirectResponse:
+async def happy_eats_brand_logo_upload(file: UploadFile = File(...)) -> Response:
     content_type = (file.content_type or "").lower()
     allowed = {"image/png", "image/jpeg", "image/jpg", "image/webp"}
     if content_type not in allowed:
@@ -494,25 +918,36 @@ async def happy_eats_brand_logo_upload(file: UploadFile = File(...)) -> Redirect
             detail=f"Unsupported content-type '{file.content_type}'. Upload PNG/JPEG/WEBP.",
         )
 
-    # Read bytes (cap to 5MB)
-    data = await file.read()
-    if not data:
-        raise HTTPException(status_code=status.HTTP_400_BAD_REQUEST, detail="Empty upload")
-    if len(data) > 5 * 1024 * 1024:
-        raise HTTPException(status_code=status.HTTP_413_REQUEST_ENTITY_TOO_LARGE, detail="File too large (max 5MB)")
-
-    # Ensure folder exists
-    os.makedirs(os.path.dirname(_happy_eats_logo_path()), exist_ok=True)
-
     # Save as logo.png (even if the user uploads jpg/webp). This keeps URLs stable.
-    with open(_happy_eats_logo_path(), "wb") as f:
-        f.write(data)
+    os.makedirs(HAPPY_EATS_LOGO_DIR, exist_ok=True)
 
-    return RedirectResponse(url="/happy-eats/brand-logo", status_code=status.HTTP_303_SEE_OTHER)
+    # Stream into a temp file in chunks (cap to 5MB) with disk writes off the
+    # event loop, then swap it in so a rejected upload never clobbers the logo.
+    total = 0
+    out, tmp_path = await run_in_threadpool(_open_logo_upload)
+    try:
+        while chunk := await file.read(UPLOAD_CHUNK_SIZE):
+            total += len(chunk)
+            if total > LOGO_MAX_BYTES:
+                raise HTTPException(
+                    status_code=status.HTTP_413_REQUEST_ENTITY_TOO_LARGE,
+                    detail="File too large (max 5MB)",
+                )
+            await run_in_threadpool(out.write, chunk)
+        await run_in_threadpool(out.close)
+        if total == 0:
+            raise HTTPException(status_code=status.HTTP_400_BAD_REQUEST, detail="Empty upload")
+        await run_in_threadpool(os.replace, tmp_path, HAPPY_EATS_LOGO_PATH)
+    except BaseException:
+        await run_in_threadpool(_discard_logo_upload, out, tmp_path)
+        raise
+    _invalidate_logo_presence()
+
+    return _see_other("/happy-eats/brand-logo")
 
 
 @app.get("/tools", response_class=HTMLResponse)
-async def tools_view(request: Request) -> HTMLResponse:
+def tools_view(request: Request) -> HTMLResponse:
     return templates.TemplateResponse(
         "tools.html",
         {
@@ -532,7 +967,7 @@ async def tools_upsert_form(
     description: str = Form(default=""),
     kind: str = Form(default="builtin"),
     entrypoint: str | None = Form(default=None),
-) -> RedirectResponse:
+) -> Response:
     payload = ToolCreate(
         id=tool_id,
         name=name,
@@ -541,8 +976,8 @@ async def tools_upsert_form(
         entrypoint=(entrypoint or None),
     )
     tool_registry.upsert(payload)
-    save_tools()
-    return RedirectResponse(url="/tools", status_code=status.HTTP_303_SEE_OTHER)
+    _mark_tools_dirty()
+    return _see_other("/tools")
 
 
 @app.post("/tools/run", response_class=HTMLResponse)
@@ -552,7 +987,7 @@ async def tools_run_form(
     input_json: str = Form(default=""),
 ) -> HTMLResponse:
     try:
-        parsed = json.loads(input_json) if input_json.strip() else {}
+        parsed = orjson.loads(input_json) if input_json.strip() else {}
         if not isinstance(parsed, dict):
             raise ValueError("Input JSON must be an object")
     except Exception as exc:
@@ -563,13 +998,37 @@ async def tools_run_form(
             {"request": request, "tools": tool_registry.list_tools(), "brands": list_brands(), "run_result": run_result},
         )
 
-    result = tool_registry.run(tool_id, ToolRunRequest(input=parsed))
+    result = await _run_tool(tool_id, ToolRunRequest(input=parsed))
     return templates.TemplateResponse(
         "tools.html",
         {"request": request, "tools": tool_registry.list_tools(), "brands": list_brands(), "run_result": result.model_dump()},
     )
 
 
+# Brand ids are validated against the brand list before quoting, so this stays
+# as small as that list; plain four-digit years need no quoting at all.
+_YEAR_RE = re.compile(r"[0-9]{4}")
+
+
+@lru_cache(maxsize=64)
+def _quote_brand(brand_id: str) -> str:
+    return quote(brand_id)
+
+
+# (checked_at, year) for the generator's default "next year"; recomputed hourly
+# so it still rolls over at New Year without a clock read per request.
+DEFAULT_YEAR_TTL_S = 3600.0
+_default_year: Optional[tuple[float, str]] = None
+
+
+def _default_generator_year() -> str:
+    global _default_year
+    now = time.monotonic()
+    if _default_year is None or now - _default_year[0] >= DEFAULT_YEAR_TTL_S:
+        _default_year = (now, str(datetime.date.today().year + 1))
+    return _default_year[1]
+
+
 @app.get("/tools/social-posts/new-year", response_class=HTMLResponse)
 async def tools_new_year_generator(
     request: Request,
@@ -578,13 +1037,14 @@ async def tools_new_year_generator(
 ) -> HTMLResponse:
     brands = list_brands()
     selected_brand = (brand or "").strip()
-    if not selected_brand or not any(b.id == selected_brand for b in brands):
+    if selected_brand not in list_brand_ids():
         selected_brand = brands[0].id if brands else "happy-eats"
 
-    resolved_year = (year or "").strip() or str(datetime.date.today().year + 1)
+    resolved_year = (year or "").strip() or _default_generator_year()
+    quoted_year = resolved_year if _YEAR_RE.fullmatch(resolved_year) else quote(resolved_year)
     generator_src = (
         "/static/tools/social-posts/new-year/index.html"
-        f"?brand={quote(selected_brand)}&year={quote(resolved_year)}"
+        f"?brand={_quote_brand(selected_brand)}&year={quoted_year}"
     )
 
     return templates.TemplateResponse(
@@ -606,12 +1066,12 @@ async def tools_collaterals_view(
 ) -> HTMLResponse:
     brands = list_brands()
     selected_brand = (brand or "").strip()
-    if not selected_brand or not any(b.id == selected_brand for b in brands):
+    if selected_brand not in list_brand_ids():
         selected_brand = brands[0].id if brands else "happy-eats"
 
     generated_index_url = f"/static/generated/{selected_brand}/collateral/index.html"
     # Only show preview link if the file exists on disk.
-    generated_exists = os.path.exists(os.path.join("app", "static", "generated", selected_brand, "collateral", "index.html"))
+    generated_exists = await _generated_collateral_exists(selected_brand)
 
     return templates.TemplateResponse(
         "tools_collaterals.html",
@@ -628,14 +1088,14 @@ async def tools_collaterals_view(
 async def tools_brand_guidelines_view(request: Request) -> HTMLResponse:
     return templates.TemplateResponse(
         "tools_brand_guidelines.html",
-        {"request": request, "samples": list_brand_guidelines_samples()},
+        {"request": request, "samples": await run_in_threadpool(list_brand_guidelines_samples)},
     )
 
 
 @app.get("/tools/brand-guidelines/samples/{sample_id}", response_class=HTMLResponse)
 async def tools_brand_guidelines_sample_view(request: Request, sample_id: str) -> HTMLResponse:
     try:
-        sample = load_brand_guidelines_sample(sample_id)
+        sample = await run_in_threadpool(load_resolved_sample, sample_id)
     except FileNotFoundError as exc:
         raise HTTPException(
             status_code=status.HTTP_404_NOT_FOUND,
@@ -647,7 +1107,6 @@ async def tools_brand_guidelines_sample_view(request: Request, sample_id: str) -
             detail=f"Failed to load sample: {exc}",
         ) from exc
 
-    sample = resolve_static_paths(sample)
     return templates.TemplateResponse(
         "tools_brand_guidelines_sample.html",
         {"request": request, "sample": sample},
@@ -657,14 +1116,14 @@ async def tools_brand_guidelines_sample_view(request: Request, sample_id: str) -
 @app.post("/tools/collaterals/generate", response_class=RedirectResponse)
 async def tools_collaterals_generate(
     brand: str = Form(...),
-) -> RedirectResponse:
-    brands = list_brands()
+) -> Response:
     selected_brand = (brand or "").strip()
-    if not selected_brand or not any(b.id == selected_brand for b in brands):
+    if selected_brand not in list_brand_ids():
         raise HTTPException(status_code=status.HTTP_400_BAD_REQUEST, detail="Unknown brand")
 
     urls = generate_collateral_pack(selected_brand)
-    return RedirectResponse(url=urls["index"], status_code=status.HTTP_303_SEE_OTHER)
+    _collateral_exists[selected_brand] = (time.monotonic(), True)
+    return _see_other(urls["index"])
 
 
 @app.get("/drive", response_class=HTMLResponse)
@@ -676,20 +1135,23 @@ async def browse_drive(
     """
     Simple browser over drives accessible to the app registration.
     """
-    selected_drive_id = drive_id or graph_client.settings.drive_id
-    use_default_drive = selected_drive_id == graph_client.settings.drive_id and drive_id is None
+    selected_drive_id = drive_id or _DEFAULT_DRIVE_ID
+    use_default_drive = selected_drive_id == _DEFAULT_DRIVE_ID and drive_id is None
     base_folder = None if use_default_drive else ""
 
     logger.info(
         "Drive browse requested drive=%s path=%s", selected_drive_id, path or "/"
     )
     try:
-        items = await graph_client.list_children(
-            path,
-            drive_id=selected_drive_id,
-            base_folder=base_folder,
+        # Independent Graph round trips; overlap them instead of awaiting in turn.
+        items, drives = await asyncio.gather(
+            graph_client.list_children(
+                path,
+                drive_id=selected_drive_id,
+                base_folder=base_folder,
+            ),
+            graph_client.list_available_drives(),
         )
-        drives = await graph_client.list_available_drives()
     except Exception as exc:  # pragma: no cover
         raise HTTPException(
             status_code=status.HTTP_502_BAD_GATEWAY,
@@ -714,7 +1176,11 @@ async def browse_drive(
 
 
 @app.get("/ledger", response_class=HTMLResponse)
-async def ledger_view(request: Request) -> HTMLResponse:
+async def ledger_view(request: Request) -> Response:
+    headers = _list_validators("ledger-page", ledger_service.version)
+    cached = _not_modified(request, headers)
+    if cached is not None:
+        return cached
     entries = ledger_service.list_entries()
     return templates.TemplateResponse(
         "ledger.html",
@@ -724,6 +1190,7 @@ async def ledger_view(request: Request) -> HTMLResponse:
             "value_tags": list(ValueTag),
             "artifact_tags": list(ArtifactType),
         },
+        headers=headers,
     )
 
 
@@ -734,12 +1201,12 @@ async def create_todo(
     details: Optional[str] = Form(default=None),
     due_date: Optional[str] = Form(default=None),
     tags: Optional[str] = Form(default=None),
-) -> RedirectResponse:
-    payload = TodoEntryCreate(
+) -> Response:
+    payload = TodoEntryCreate.model_construct(
         title=title,
         details=details or None,
         due_date=due_date or None,
-        tags=[t.strip() for t in (tags or "").split(",") if t.strip()],
+        tags=_split_csv(tags),
     )
     try:
         await todo_service.add_entry(payload)
@@ -748,7 +1215,7 @@ async def create_todo(
             status_code=status.HTTP_502_BAD_GATEWAY,
             detail=f"Failed to record todo: {exc}",
         ) from exc
-    return RedirectResponse(url="/", status_code=status.HTTP_303_SEE_OTHER)
+    return _form_submit_response(request, "/")
 
 
 @app.post("/ledger", response_class=HTMLResponse)
@@ -762,8 +1229,8 @@ async def ledger_form_submit(
     value_tags: Optional[str] = Form(default=None),
     artifact_tags: Optional[str] = Form(default=None),
     references: Optional[str] = Form(default=None),
-) -> RedirectResponse:
-    payload = LedgerEntryCreate(
+) -> Response:
+    payload = LedgerEntryCreate.model_construct(
         title=title,
         summary=summary,
         theme=theme,
@@ -771,7 +1238,7 @@ async def ledger_form_submit(
         project=project or None,
         value_tags=_parse_enum_list(value_tags, ValueTag),
         artifact_tags=_parse_enum_list(artifact_tags, ArtifactType),
-        references=[line.strip() for line in (references or "").splitlines() if line.strip()],
+        references=_split_lines(references),
     )
     try:
         await ledger_service.log_entry(payload, source="web-ledger", actor="memory-router")
@@ -781,16 +1248,16 @@ async def ledger_form_submit(
             detail=f"Failed to record ledger entry: {exc}",
         ) from exc
 
-    return RedirectResponse(url="/ledger", status_code=status.HTTP_303_SEE_OTHER)
+    return _form_submit_response(request, "/ledger")
 
 
 @app.get("/api/drive/children")
-async def api_drive_children(path: Optional[str] = None, drive_id: Optional[str] = None) -> JSONResponse:
+async def api_drive_children(path: Optional[str] = None, drive_id: Optional[str] = None) -> ORJSONResponse:
     """
     JSON API for listing items in a drive (defaults to configured drive).
     """
-    selected_drive_id = drive_id or graph_client.settings.drive_id
-    use_default_drive = selected_drive_id == graph_client.settings.drive_id and drive_id is None
+    selected_drive_id = drive_id or _DEFAULT_DRIVE_ID
+    use_default_drive = selected_drive_id == _DEFAULT_DRIVE_ID and drive_id is None
     base_folder = None if use_default_drive else ""
 
     logger.info(
@@ -808,11 +1275,11 @@ async def api_drive_children(path: Optional[str] = None, drive_id: Optional[str]
             detail=f"Failed to list drive items: {exc}",
         ) from exc
 
-    return JSONResponse(content={"path": path or "", "drive_id": selected_drive_id, "items": items})
+    return ORJSONResponse(content={"path": path or "", "drive_id": selected_drive_id, "items": items})
 
 
 @app.get("/api/drives")
-async def api_list_drives() -> JSONResponse:
+async def api_list_drives() -> ORJSONResponse:
     logger.info("API drive list requested")
     try:
         drives = await graph_client.list_available_drives()
@@ -821,14 +1288,14 @@ async def api_list_drives() -> JSONResponse:
             status_code=status.HTTP_502_BAD_GATEWAY,
             detail=f"Failed to list drives: {exc}",
         ) from exc
-    return JSONResponse(content={"drives": drives})
+    return ORJSONResponse(content={"drives": drives})
 
 
 @app.get("/drive/download/{item_id}")
 async def download_drive_item(item_id: str, drive_id: Optional[str] = None) -> StreamingResponse:
     logger.info("Download requested item=%s drive=%s", item_id, drive_id or "default")
     try:
-        content, content_type, filename = await graph_client.download_item(
+        chunks, content_type, filename, close = await graph_client.stream_item(
             item_id,
             drive_id=drive_id,
         )
@@ -838,17 +1305,25 @@ async def download_drive_item(item_id: str, drive_id: Optional[str] = None) -> S
             detail=f"Failed to download file: {exc}",
         ) from exc
 
+    # The background task releases the Graph connection even if the body is
+    # never iterated (client gone before the first chunk).
     return StreamingResponse(
-        io.BytesIO(content),
+        chunks,
         media_type=content_type,
         headers={
             "Content-Disposition": f'attachment; filename="{filename}"',
         },
+        background=BackgroundTask(close),
     )
 
 
-@app.post("/api/ledger", response_model=LedgerEntryNormalized)
-async def api_log_ledger(payload: LedgerEntryCreate) -> LedgerEntryNormalized:
+@app.post(
+    "/api/ledger",
+    response_model=LedgerEntryNormalized,
+    openapi_extra=_json_body_openapi(LedgerEntryCreate),
+)
+async def api_log_ledger(request: Request) -> LedgerEntryNormalized:
+    payload = await _read_json_body(request, LedgerEntryCreate)
     try:
         entry = await ledger_service.log_entry(payload, source="api-ledger", actor="api")
     except Exception as exc:  # pragma: no cover
@@ -859,13 +1334,18 @@ async def api_log_ledger(payload: LedgerEntryCreate) -> LedgerEntryNormalized:
     return entry
 
 
-@app.get("/api/ledger", response_model=List[LedgerEntryNormalized])
-async def api_list_ledger_entries() -> List[LedgerEntryNormalized]:
-    return ledger_service.list_entries()
+@app.get("/api/ledger", responses={200: {"model": List[LedgerEntryNormalized]}})
+async def api_list_ledger_entries(request: Request) -> Response:
+    return _list_response(request, "ledger", ledger_service.version, ledger_service.list_entries)
 
 
-@app.post("/api/todos", response_model=TodoEntryNormalized)
-async def api_create_todo(payload: TodoEntryCreate) -> TodoEntryNormalized:
+@app.post(
+    "/api/todos",
+    response_model=TodoEntryNormalized,
+    openapi_extra=_json_body_openapi(TodoEntryCreate),
+)
+async def api_create_todo(request: Request) -> TodoEntryNormalized:
+    payload = await _read_json_body(request, TodoEntryCreate)
     try:
         return await todo_service.add_entry(payload)
     except Exception as exc:  # pragma: no cover
@@ -875,27 +1355,32 @@ async def api_create_todo(payload: TodoEntryCreate) -> TodoEntryNormalized:
         ) from exc
 
 
-@app.get("/api/todos", response_model=List[TodoEntryNormalized])
-async def api_list_todos() -> List[TodoEntryNormalized]:
-    return todo_service.list_entries()
+@app.get("/api/todos", responses={200: {"model": List[TodoEntryNormalized]}})
+async def api_list_todos(request: Request) -> Response:
+    return _list_response(request, "todos", todo_service.version, todo_service.list_entries)
 
 
 @app.get("/entries", response_class=HTMLResponse)
-async def list_entries_view(request: Request) -> HTMLResponse:
+async def list_entries_view(request: Request) -> Response:
+    headers = _list_validators("entries-page", _entries_version)
+    cached = _not_modified(request, headers)
+    if cached is not None:
+        return cached
     # Newest first
-    entries = sorted(IN_MEMORY_ENTRIES, key=lambda e: e.created_at, reverse=True)
+    entries = list(reversed(IN_MEMORY_ENTRIES))
     return templates.TemplateResponse(
         "entries.html",
         {
             "request": request,
             "entries": entries,
         },
+        headers=headers,
     )
 
 
-@app.get("/api/entries", response_model=List[EntryNormalized])
-async def list_entries_api() -> List[EntryNormalized]:
-    return sorted(IN_MEMORY_ENTRIES, key=lambda e: e.created_at, reverse=True)
+@app.get("/api/entries", responses={200: {"model": List[EntryNormalized]}})
+async def list_entries_api(request: Request) -> Response:
+    return _list_response(request, "entries", _entries_version, lambda: reversed(IN_MEMORY_ENTRIES))
 
 
 @app.post("/submit", response_class=HTMLResponse)
@@ -907,16 +1392,12 @@ async def submit_form(
     tags: Optional[str] = Form(default=None),
     progress_stage: Optional[str] = Form(default=None),
     progress_notes: Optional[str] = Form(default=None),
-) -> RedirectResponse:
-    tags_list: List[str] = []
-    if tags:
-        tags_list = [t.strip() for t in tags.split(",") if t.strip()]
-
-    payload = EntryCreate(
+) -> Response:
+    payload = EntryCreate.model_construct(
         project=project or None,
         category=category,
         content_raw=content,
-        tags=tags_list,
+        tags=_split_csv(tags),
         progress_stage=progress_stage or None,
         progress_notes=progress_notes or None,
     )
@@ -931,14 +1412,19 @@ async def submit_form(
             detail=f"Failed to upload to SharePoint: {exc}",
         ) from exc
 
-    IN_MEMORY_ENTRIES.append(entry)
+    _remember_entry(entry)
     await _record_ledger_for_entry(entry, item_id=item_id, source="web_form")
 
-    return RedirectResponse(url="/entries", status_code=status.HTTP_303_SEE_OTHER)
+    return _form_submit_response(request, "/entries")
 
 
-@app.post("/api/entries", response_model=EntryNormalized)
-async def create_entry_api(payload: EntryCreate) -> EntryNormalized:
+@app.post(
+    "/api/entries",
+    response_model=EntryNormalized,
+    openapi_extra=_json_body_openapi(EntryCreate),
+)
+async def create_entry_api(request: Request) -> EntryNormalized:
+    payload = await _read_json_body(request, EntryCreate)
     entry = build_normalized_entry(payload, source="api")
 
     logger.info("API entry submission project=%s category=%s", payload.project, payload.category)
@@ -950,7 +1436,7 @@ async def create_entry_api(payload: EntryCreate) -> EntryNormalized:
             detail=f"Failed to upload to SharePoint: {exc}",
         ) from exc
 
-    IN_MEMORY_ENTRIES.append(entry)
+    _remember_entry(entry)
     await _record_ledger_for_entry(entry, item_id=item_id, source="api")
     return entry
 
@@ -969,7 +1455,7 @@ async def log_project_progress(
       - project derived from the path
       - stage + note captured in dedicated fields
     """
-    payload = EntryCreate(
+    payload = EntryCreate.model_construct(
         project=project_name,
         category=EntryCategory.PROGRESS,
         content_raw=note,
@@ -990,33 +1476,28 @@ async def log_project_progress(
             detail=f"Failed to upload to SharePoint: {exc}",
         ) from exc
 
-    IN_MEMORY_ENTRIES.append(entry)
+    _remember_entry(entry)
     await _record_ledger_for_entry(entry, item_id=item_id, source="api-progress")
     return entry
 
 
 @app.get("/health")
-async def health() -> dict:
+async def health(fresh: bool = False) -> dict:
     """
     Basic health check including Graph connectivity.
-    """
-    graph_ok = False
-    try:
-        graph_ok = await graph_client.health_check()
-    except Exception:
-        graph_ok = False
 
-    outcome = {
-        "status": "ok" if graph_ok else "degraded",
-        "graph": "ok" if graph_ok else "unreachable",
-    }
-    logger.info("Health check result: %s", outcome)
-    return outcome
+    Returns the latest background probe, re-probing if it is older than
+    HEALTH_MAX_AGE_S; pass `fresh=true` to probe Graph now.
+    """
+    cached = _health
+    if fresh or cached is None or time.monotonic() - cached[0] > HEALTH_MAX_AGE_S:
+        return await _probe_health()
+    return dict(cached[1])
 
 
-@app.get("/api/tools", response_model=List[ToolSpec])
-async def api_list_tools() -> List[ToolSpec]:
-    return tool_registry.list_tools()
+@app.get("/api/tools", responses={200: {"model": List[ToolSpec]}})
+async def api_list_tools(request: Request) -> Response:
+    return _list_response(request, "tools", tool_registry.version, tool_registry.list_tools)
 
 
 @app.put("/api/tools/{tool_id}", response_model=ToolSpec)
@@ -1024,58 +1505,68 @@ async def api_upsert_tool(tool_id: str, payload: ToolCreate) -> ToolSpec:
     if payload.id != tool_id:
         raise HTTPException(status_code=status.HTTP_400_BAD_REQUEST, detail="tool_id mismatch")
     spec = tool_registry.upsert(payload)
-    save_tools()
+    _mark_tools_dirty()
     return spec
 
 
 @app.delete("/api/tools/{tool_id}")
-async def api_delete_tool(tool_id: str) -> JSONResponse:
+async def api_delete_tool(tool_id: str) -> ORJSONResponse:
     tool_registry.delete(tool_id)
-    save_tools()
-    return JSONResponse(content={"ok": True})
+    _mark_tools_dirty()
+    return ORJSONResponse(content={"ok": True})
 
 
 @app.post("/api/tools/{tool_id}/run", response_model=ToolRunResult)
 async def api_run_tool(tool_id: str, payload: ToolRunRequest) -> ToolRunResult:
-    return tool_registry.run(tool_id, payload)
+    return await _run_tool(tool_id, payload)
+
+
+# git commands fork a subprocess and can take seconds (network, rebase), so they
+# run in the threadpool; one at a time, since git serializes on index.lock anyway.
+_git_lock = asyncio.Lock()
+
+
+async def _run_git_op(op: Callable[..., Any], *args: Any) -> Any:
+    async with _git_lock:
+        return await run_in_threadpool(op, _repo_root(), *args)
 
 
 @app.get("/api/git/status")
-async def api_git_status() -> JSONResponse:
+async def api_git_status() -> ORJSONResponse:
     """Return git status for the local repo this service is running from."""
     try:
-        status_data = get_status(_repo_root())
+        status_data = await _run_git_op(get_status)
     except GitError as exc:
         raise HTTPException(status_code=status.HTTP_400_BAD_REQUEST, detail=str(exc)) from exc
     except Exception as exc:  # pragma: no cover
         raise HTTPException(status_code=status.HTTP_500_INTERNAL_SERVER_ERROR, detail=str(exc)) from exc
-    return JSONResponse(content=status_data)
+    return ORJSONResponse(content=status_data)
 
 
 @app.post("/api/git/fetch")
-async def api_git_fetch() -> JSONResponse:
+async def api_git_fetch() -> ORJSONResponse:
     try:
-        result = fetch(_repo_root())
+        result = await _run_git_op(fetch)
     except GitError as exc:
         raise HTTPException(status_code=status.HTTP_400_BAD_REQUEST, detail=str(exc)) from exc
     except Exception as exc:  # pragma: no cover
         raise HTTPException(status_code=status.HTTP_500_INTERNAL_SERVER_ERROR, detail=str(exc)) from exc
-    return JSONResponse(content=result)
+    return ORJSONResponse(content=result)
 
 
 @app.post("/api/git/pull")
-async def api_git_pull() -> JSONResponse:
+async def api_git_pull() -> ORJSONResponse:
     """Pull changes from origin using rebase.
 
     If conflicts occur, the endpoint returns 409 and includes the list of conflicted files.
     """
     try:
-        result = pull_rebase(_repo_root())
-        return JSONResponse(content=result)
+        result = await _run_git_op(pull_rebase)
+        return ORJSONResponse(content=result)
     except GitError as exc:
         # Distinguish conflicts from other errors.
         try:
-            files = conflict_files(_repo_root())
+            files = await _run_git_op(conflict_files)
         except Exception:
             files = []
         if files:
@@ -1087,30 +1578,30 @@ async def api_git_pull() -> JSONResponse:
 
 
 @app.post("/api/git/push")
-async def api_git_push() -> JSONResponse:
+async def api_git_push() -> ORJSONResponse:
     try:
-        result = push(_repo_root())
+        result = await _run_git_op(push)
     except GitError as exc:
         raise HTTPException(status_code=status.HTTP_400_BAD_REQUEST, detail=str(exc)) from exc
     except Exception as exc:  # pragma: no cover
         raise HTTPException(status_code=status.HTTP_500_INTERNAL_SERVER_ERROR, detail=str(exc)) from exc
-    return JSONResponse(content=result)
+    return ORJSONResponse(content=result)
 
 
 @app.get("/api/git/conflicts")
-async def api_git_conflicts() -> JSONResponse:
+async def api_git_conflicts() -> ORJSONResponse:
     try:
-        files = conflict_files(_repo_root())
+        files = await _run_git_op(conflict_files)
     except GitError as exc:
         raise HTTPException(status_code=status.HTTP_400_BAD_REQUEST, detail=str(exc)) from exc
-    return JSONResponse(content={"conflicts": files})
+    return ORJSONResponse(content={"conflicts": files})
 
 
 @app.get("/api/git/conflicts/preview")
-async def api_git_conflict_preview(path: str) -> JSONResponse:
+async def api_git_conflict_preview(path: str) -> ORJSONResponse:
     """Preview a conflicted file (first ~200 lines) to help manual resolution."""
     try:
-        preview = conflict_markers_preview(_repo_root(), path)
+        preview = await _run_git_op(conflict_markers_preview, path)
     except GitError as exc:
         raise HTTPException(status_code=status.HTTP_400_BAD_REQUEST, detail=str(exc)) from exc
-    return JSONResponse(content={"path": path, "preview": preview})
+    return ORJSONResponse(content={"path": path, "preview": preview})
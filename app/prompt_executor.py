@@ -5,12 +5,32 @@ This module automatically feeds implementation prompts to the user/Copilot
 in a sequential manner, tracking completion and managing dependencies.
 """
 
-import json
+import heapq
+import os
 import time
+from collections import Counter, defaultdict
+from contextlib import contextmanager
 from pathlib import Path
-from typing import List, Dict, Optional
+from typing import FrozenSet, List, Dict, Optional, Set, Tuple
 from datetime import datetime
 
+import orjson
+
+
+# Ready prompts are handed out highest priority first, then by id.
+PRIORITY_RANK = {"critical": 0, "high": 1, "medium": 2, "low": 3}
+
+# Mutations are appended to a write-ahead log; the JSON snapshot is only
+# rewritten (and the log truncated) on compaction.
+WAL_COMPACT_LINES = 200
+
+
+def _iso(ts) -> str:
+    """Render a stored timestamp for display (older state files hold ISO strings)"""
+    if isinstance(ts, str):
+        return ts
+    return datetime.fromtimestamp(ts).isoformat(timespec='seconds')
+
 
 class PromptExecutor:
     """Manages sequential execution of implementation prompts"""
@@ -18,13 +38,32 @@ class PromptExecutor:
     def __init__(self, prompts_file: str = "implementation_prompts.json"):
         self.prompts_file = Path(prompts_file)
         self.state_file = Path("execution_state.json")
+        self.wal_file = self.state_file.with_suffix(".wal")
+        self._wal_fp = None
+        self._wal_lines = 0
+        # Log records held back while inside batch(); None when not batching.
+        self._pending: Optional[List[bytes]] = None
         self.prompts: List[Dict] = []
+        self._by_id: Dict[int, Dict] = {}
+        self._chat_prompts: Dict[int, str] = {}
+        self._remaining_by_priority: Counter = Counter()
+        # Deduplicated deps per prompt, reverse dependency edges and, per prompt,
+        # how many deps are still open.
+        self._deps: Dict[int, FrozenSet[int]] = {}
+        self._dependents: Dict[int, List[int]] = defaultdict(list)
+        self._unmet: Dict[int, int] = {}
+        # Heap of (priority rank, id) for prompts whose deps are all completed.
+        # Entries completed since they were pushed are dropped lazily.
+        self._ready: List[Tuple[int, int]] = []
+        # Authoritative completion set; state['completed_ids'] mirrors it for the JSON file.
+        self._completed: Set[int] = set()
         self.state: Dict = {
             "completed_ids": [],
             "current_id": None,
             "started_at": None,
             "last_updated": None,
-            "execution_log": []
+            "execution_log": [],
+            "wal_seq": 0
         }
 
         self._load_prompts()
@@ -32,98 +71,228 @@ class PromptExecutor:
 
     def _load_prompts(self):
         """Load prompts from JSON file"""
-        if not self.prompts_file.exists():
-            raise FileNotFoundError(f"Prompts file not found: {self.prompts_file}")
-
-        with open(self.prompts_file, 'r', encoding='utf-8') as f:
-            data = json.load(f)
-            self.prompts = data['prompts']
+        try:
+            raw = self.prompts_file.read_bytes()
+        except FileNotFoundError:
+            raise FileNotFoundError(f"Prompts file not found: {self.prompts_file}") from None
+        self.prompts = orjson.loads(raw)['prompts']
+
+        # Hand-out order: priority first, then id, so every scan is already ranked.
+        self.prompts.sort(key=self._ready_key)
+        self._by_id = {p['id']: p for p in self.prompts}
+        self._chat_prompts = {}
+        self._deps = {p['id']: frozenset(p.get('dependencies', ())) for p in self.prompts}
+        self._dependents = defaultdict(list)
+        for prompt_id, deps in self._deps.items():
+            for dep in deps:
+                self._dependents[dep].append(prompt_id)
 
     def _load_state(self):
         """Load execution state"""
-        if self.state_file.exists():
-            with open(self.state_file, 'r', encoding='utf-8') as f:
-                self.state = json.load(f)
-        else:
+        try:
+            self.state = orjson.loads(self.state_file.read_bytes())
+        except FileNotFoundError:
             self._save_state()
+        self._completed = set(self.state['completed_ids'])
+        self._replay_wal()
+        self._build_ready_queue()
+
+    def _replay_wal(self):
+        """Re-apply logged mutations newer than the snapshot"""
+        if not self.wal_file.exists():
+            return
+        torn = False
+        with open(self.wal_file, 'rb') as f:
+            for line in f:
+                try:
+                    event = orjson.loads(line)
+                except ValueError:
+                    torn = True  # interrupted final write
+                    break
+                self._wal_lines += 1
+                if event['seq'] > self.state.get('wal_seq', 0):
+                    self._apply(event)
+        if torn:
+            # Don't let new records get appended onto the partial line.
+            self.compact()
+
+    def _apply(self, event: Dict):
+        """Apply one logged mutation to the in-memory state"""
+        op, prompt_id, at = event['op'], event['id'], event['at']
+        if op == "complete":
+            if prompt_id not in self._completed:
+                self._completed.add(prompt_id)
+                self.state['completed_ids'].append(prompt_id)
+                self.state['execution_log'].append({
+                    "prompt_id": prompt_id,
+                    "completed_at": at,
+                    "notes": event.get('notes', "")
+                })
+        elif op == "current":
+            self.state['current_id'] = prompt_id
+            if self.state['started_at'] is None:
+                self.state['started_at'] = at
+        elif op == "skip":
+            self.state['execution_log'].append({
+                "prompt_id": prompt_id,
+                "skipped_at": at,
+                "reason": event.get('reason', "")
+            })
+        self.state['wal_seq'] = event['seq']
+        self.state['last_updated'] = at
+
+    def _record(self, op: str, prompt_id: int, **fields):
+        """Apply a mutation and append it to the write-ahead log"""
+        event = {
+            "seq": self.state.get('wal_seq', 0) + 1,
+            "op": op,
+            "id": prompt_id,
+            "at": time.time(),
+            **fields
+        }
+        self._apply(event)
+        line = orjson.dumps(event, option=orjson.OPT_APPEND_NEWLINE)
+        self._wal_lines += 1
+        if self._pending is not None:
+            self._pending.append(line)
+        else:
+            self._append_wal(line)
+
+    def _append_wal(self, data: bytes):
+        if self._wal_fp is None:
+            # Unbuffered so every record reaches the file as one write.
+            self._wal_fp = open(self.wal_file, 'ab', buffering=0)
+        self._wal_fp.write(data)
+        if self._wal_lines >= WAL_COMPACT_LINES:
+            self.compact()
+
+    @contextmanager
+    def batch(self):
+        """Group mutations into one log write:
+
+            with executor.batch():
+                for prompt_id in ids:
+                    executor.mark_completed(prompt_id)
+        """
+        if self._pending is not None:
+            yield  # already inside an outer batch
+            return
+        self._pending = []
+        try:
+            yield
+        finally:
+            pending, self._pending = self._pending, None
+            if pending:
+                self._append_wal(b"".join(pending))
+
+    def compact(self):
+        """Fold the write-ahead log into the JSON snapshot and truncate it"""
+        self._save_state()
+        if self._pending is not None:
+            self._pending.clear()  # now part of the snapshot
+        if self._wal_fp is not None:
+            self._wal_fp.close()
+            self._wal_fp = None
+        if self.wal_file.exists():
+            self.wal_file.write_text("", encoding='utf-8')
+        self._wal_lines = 0
+
+    def _build_ready_queue(self):
+        """Count open dependencies per prompt and seed the ready heap (Kahn's algorithm)"""
+        self._completed = set(self.state['completed_ids'])
+        self._unmet = {}
+        self._ready = []
+        self._remaining_by_priority = Counter(
+            p['priority'] for p in self.prompts if p['id'] not in self._completed
+        )
+        for prompt in self.prompts:
+            unmet = len(self._deps[prompt['id']] - self._completed)
+            self._unmet[prompt['id']] = unmet
+            if unmet == 0 and prompt['id'] not in self._completed:
+                self._ready.append(self._ready_key(prompt))
+        heapq.heapify(self._ready)
+
+    @staticmethod
+    def _ready_key(prompt: Dict) -> Tuple[int, int]:
+        return PRIORITY_RANK.get(prompt['priority'], len(PRIORITY_RANK)), prompt['id']
+
+    def _ready_ids(self, limit: Optional[int] = None) -> List[int]:
+        """Ids of executable prompts (the first `limit` of them if given), in hand-out order"""
+        live = (entry for entry in self._ready if entry[1] not in self._completed)
+        entries = sorted(live) if limit is None else heapq.nsmallest(limit, live)
+        return [pid for _, pid in entries]
 
     def _save_state(self):
         """Persist execution state"""
-        self.state['last_updated'] = datetime.now().isoformat()
-        with open(self.state_file, 'w', encoding='utf-8') as f:
-            json.dump(self.state, f, indent=2)
+        self.state['last_updated'] = time.time()
+        # Write beside the snapshot and rename over it so a crash never leaves it truncated.
+        tmp = self.state_file.with_suffix('.json.tmp')
+        with open(tmp, 'wb') as f:
+            f.write(orjson.dumps(self.state))
+            f.flush()
+            os.fsync(f.fileno())
+        os.replace(tmp, self.state_file)
 
     def get_next_prompt(self) -> Optional[Dict]:
         """Get the next executable prompt based on dependencies"""
-        completed = set(self.state['completed_ids'])
-
-        for prompt in self.prompts:
-            prompt_id = prompt['id']
-
-            # Skip if already completed
-            if prompt_id in completed:
-                continue
-
-            # Check if all dependencies are completed
-            dependencies = set(prompt.get('dependencies', []))
-            if dependencies.issubset(completed):
-                return prompt
-
+        while self._ready:
+            prompt_id = self._ready[0][1]
+            if prompt_id not in self._completed:
+                return self._by_id[prompt_id]
+            heapq.heappop(self._ready)
         return None
 
     def mark_completed(self, prompt_id: int, notes: str = ""):
         """Mark a prompt as completed"""
-        if prompt_id not in self.state['completed_ids']:
-            self.state['completed_ids'].append(prompt_id)
-            self.state['execution_log'].append({
-                "prompt_id": prompt_id,
-                "completed_at": datetime.now().isoformat(),
-                "notes": notes
-            })
-            self._save_state()
+        if prompt_id not in self._completed:
+            self._record("complete", prompt_id, notes=notes)
+            if prompt_id in self._by_id:
+                self._remaining_by_priority[self._by_id[prompt_id]['priority']] -= 1
+            for dependent in self._dependents.get(prompt_id, ()):
+                self._unmet[dependent] -= 1
+                if self._unmet[dependent] == 0 and dependent not in self._completed:
+                    heapq.heappush(self._ready, self._ready_key(self._by_id[dependent]))
 
     def mark_current(self, prompt_id: int):
         """Mark a prompt as currently in progress"""
-        self.state['current_id'] = prompt_id
-        if self.state['started_at'] is None:
-            self.state['started_at'] = datetime.now().isoformat()
-        self._save_state()
+        self._record("current", prompt_id)
 
     def skip_prompt(self, prompt_id: int, reason: str = ""):
         """Skip a prompt (won't be executed)"""
-        self.state['execution_log'].append({
-            "prompt_id": prompt_id,
-            "skipped_at": datetime.now().isoformat(),
-            "reason": reason
-        })
         # Don't add to completed_ids, but mark as processed
-        self._save_state()
+        self._record("skip", prompt_id, reason=reason)
+
+    def reset(self):
+        """Forget all progress"""
+        self.state = {
+            "completed_ids": [],
+            "current_id": None,
+            "started_at": None,
+            "last_updated": None,
+            "execution_log": [],
+            # Keep the sequence so stale log lines can never replay over the reset.
+            "wal_seq": self.state.get('wal_seq', 0)
+        }
+        self._build_ready_queue()
+        self.compact()
 
     def get_progress(self) -> Dict:
         """Get execution progress statistics"""
         total = len(self.prompts)
         completed = len(self.state['completed_ids'])
 
-        # Calculate remaining by priority
-        remaining_by_priority = {}
-        for prompt in self.prompts:
-            if prompt['id'] not in self.state['completed_ids']:
-                priority = prompt['priority']
-                remaining_by_priority[priority] = remaining_by_priority.get(priority, 0) + 1
+        # Remaining by priority is maintained on completion; drop exhausted buckets.
+        remaining_by_priority = {p: n for p, n in self._remaining_by_priority.items() if n > 0}
 
         # Get next executable prompts
         next_prompts = []
-        completed_set = set(self.state['completed_ids'])
-        for prompt in self.prompts:
-            if prompt['id'] in completed_set:
-                continue
-            deps = set(prompt.get('dependencies', []))
-            if deps.issubset(completed_set):
-                next_prompts.append({
-                    'id': prompt['id'],
-                    'title': prompt['title'],
-                    'priority': prompt['priority']
-                })
+        for prompt_id in self._ready_ids():
+            prompt = self._by_id[prompt_id]
+            next_prompts.append({
+                'id': prompt['id'],
+                'title': prompt['title'],
+                'priority': prompt['priority']
+            })
 
         return {
             'total': total,
@@ -137,12 +306,16 @@ class PromptExecutor:
 
     def generate_chat_prompt(self, prompt_id: int) -> str:
         """Generate a formatted chat prompt for VS Code Copilot"""
-        prompt = next((p for p in self.prompts if p['id'] == prompt_id), None)
+        cached = self._chat_prompts.get(prompt_id)
+        if cached is not None:
+            return cached
+
+        prompt = self._by_id.get(prompt_id)
         if not prompt:
             raise ValueError(f"Prompt ID {prompt_id} not found")
 
         # Format as a natural language instruction for Copilot
-        chat_prompt = f"""## Task #{prompt['id']}: {prompt['title']}
+        parts = [f"""## Task #{prompt['id']}: {prompt['title']}
 
 **Category:** {prompt['category']}
 **Priority:** {prompt['priority']}
@@ -151,111 +324,108 @@ class PromptExecutor:
 {prompt['prompt']}
 
 **Acceptance Criteria:**
-"""
-        for criteria in prompt['acceptance_criteria']:
-            chat_prompt += f"\n- {criteria}"
+"""]
+        parts.extend(f"\n- {criteria}" for criteria in prompt['acceptance_criteria'])
 
         if prompt.get('files_to_create'):
-            chat_prompt += "\n\n**Files to Create:**\n"
-            for file in prompt['files_to_create']:
-                chat_prompt += f"- {file}\n"
+            parts.append("\n\n**Files to Create:**\n")
+            parts.extend(f"- {path}\n" for path in prompt['files_to_create'])
 
         if prompt.get('files_to_modify'):
-            chat_prompt += "\n**Files to Modify:**\n"
-            for file in prompt['files_to_modify']:
-                chat_prompt += f"- {file}\n"
+            parts.append("\n**Files to Modify:**\n")
+            parts.extend(f"- {path}\n" for path in prompt['files_to_modify'])
 
-        chat_prompt += "\n\nPlease implement this task now."
+        parts.append("\n\nPlease implement this task now.")
+        chat_prompt = "".join(parts)
 
+        self._chat_prompts[prompt_id] = chat_prompt
         return chat_prompt
 
     def export_next_prompts_batch(self, output_file: str = "next_prompts.txt", count: int = 3):
         """Export the next N prompts ready for execution to a text file"""
-        completed_set = set(self.state['completed_ids'])
-        next_prompts = []
-
-        for prompt in self.prompts:
-            if len(next_prompts) >= count:
-                break
-            if prompt['id'] in completed_set:
-                continue
-            deps = set(prompt.get('dependencies', []))
-            if deps.issubset(completed_set):
-                next_prompts.append(prompt)
+        next_prompts = [self._by_id[prompt_id] for prompt_id in self._ready_ids(count)]
+
+        rule = "=" * 80 + "\n"
+        parts = [
+            rule,
+            "NEXT IMPLEMENTATION PROMPTS FOR VS CODE COPILOT\n",
+            rule + "\n",
+            f"Generated: {datetime.now().strftime('%Y-%m-%d %H:%M:%S')}\n",
+            f"Progress: {len(self.state['completed_ids'])}/{len(self.prompts)} completed\n\n",
+        ]
+        for i, prompt in enumerate(next_prompts, 1):
+            parts.append(f"{rule}PROMPT {i} of {len(next_prompts)}\n{rule}\n")
+            parts.append(self.generate_chat_prompt(prompt['id']))
+            parts.append("\n\n")
 
         with open(output_file, 'w', encoding='utf-8') as f:
-            f.write("=" * 80 + "\n")
-            f.write("NEXT IMPLEMENTATION PROMPTS FOR VS CODE COPILOT\n")
-            f.write("=" * 80 + "\n\n")
-            f.write(f"Generated: {datetime.now().strftime('%Y-%m-%d %H:%M:%S')}\n")
-            f.write(f"Progress: {len(self.state['completed_ids'])}/{len(self.prompts)} completed\n\n")
-
-            for i, prompt in enumerate(next_prompts, 1):
-                f.write("=" * 80 + "\n")
-                f.write(f"PROMPT {i} of {len(next_prompts)}\n")
-                f.write("=" * 80 + "\n\n")
-                f.write(self.generate_chat_prompt(prompt['id']))
-                f.write("\n\n")
+            f.writelines(parts)
 
         return len(next_prompts)
 
     def interactive_mode(self):
         """Run interactive prompt execution"""
-        print("\n" + "=" * 80)
-        print("🤖 PROMPT EXECUTOR - Interactive Mode")
-        print("=" * 80 + "\n")
+        while True:
+            print("\n" + "=" * 80)
+            print("🤖 PROMPT EXECUTOR - Interactive Mode")
+            print("=" * 80 + "\n")
 
-        progress = self.get_progress()
-        print(f"Progress: {progress['completed']}/{progress['total']} ({progress['progress_percentage']}%)")
-        print(f"Remaining: {progress['remaining']} tasks\n")
+            progress = self.get_progress()
+            print(f"Progress: {progress['completed']}/{progress['total']} ({progress['progress_percentage']}%)")
+            print(f"Remaining: {progress['remaining']} tasks")
+            if self.state['started_at'] is not None:
+                print(f"Started: {_iso(self.state['started_at'])}")
+            print()
 
-        if not progress['next_executable']:
-            print("✅ All tasks completed or blocked by dependencies!")
-            return
+            if not progress['next_executable']:
+                print("✅ All tasks completed or blocked by dependencies!")
+                return
 
-        print(f"📋 Next executable tasks ({len(progress['next_executable'])}):\n")
-        for p in progress['next_executable']:
-            print(f"   #{p['id']} - {p['title']} ({p['priority']})")
+            print(f"📋 Next executable tasks ({len(progress['next_executable'])}):\n")
+            for p in progress['next_executable']:
+                print(f"   #{p['id']} - {p['title']} ({p['priority']})")
 
-        print("\n" + "-" * 80 + "\n")
+            print("\n" + "-" * 80 + "\n")
 
-        next_prompt = self.get_next_prompt()
-        if not next_prompt:
-            print("No executable prompts found.")
-            return
+            next_prompt = self.get_next_prompt()
+            if not next_prompt:
+                print("No executable prompts found.")
+                return
 
-        print(f"🚀 Ready to execute: #{next_prompt['id']} - {next_prompt['title']}\n")
+            print(f"🚀 Ready to execute: #{next_prompt['id']} - {next_prompt['title']}\n")
 
-        response = input("Execute this prompt? [y/n/s(kip)/q(uit)]: ").strip().lower()
+            response = input("Execute this prompt? [y/n/s(kip)/q(uit)]: ").strip().lower()
 
-        if response == 'y':
-            self.mark_current(next_prompt['id'])
-            print("\n" + "=" * 80)
-            print("COPY THE PROMPT BELOW TO VS CODE COPILOT CHAT:")
-            print("=" * 80 + "\n")
-            print(self.generate_chat_prompt(next_prompt['id']))
-            print("\n" + "=" * 80 + "\n")
+            if response == 'y':
+                self.mark_current(next_prompt['id'])
+                print("\n" + "=" * 80)
+                print("COPY THE PROMPT BELOW TO VS CODE COPILOT CHAT:")
+                print("=" * 80 + "\n")
+                print(self.generate_chat_prompt(next_prompt['id']))
+                print("\n" + "=" * 80 + "\n")
 
-            input("Press Enter after Copilot completes the task...")
-            notes = input("Any notes for completion log? (optional): ").strip()
-            self.mark_completed(next_prompt['id'], notes)
-            print(f"✅ Task #{next_prompt['id']} marked as completed!\n")
+                input("Press Enter after Copilot completes the task...")
+                notes = input("Any notes for completion log? (optional): ").strip()
+                self.mark_completed(next_prompt['id'], notes)
+                print(f"✅ Task #{next_prompt['id']} marked as completed!\n")
 
-            # Continue with next task
-            self.interactive_mode()
+                # Continue with next task
+                continue
 
-        elif response == 's':
-            reason = input("Reason for skipping: ").strip()
-            self.skip_prompt(next_prompt['id'], reason)
-            print(f"⏭️  Task #{next_prompt['id']} skipped.\n")
-            self.interactive_mode()
+            elif response == 's':
+                reason = input("Reason for skipping: ").strip()
+                self.skip_prompt(next_prompt['id'], reason)
+                print(f"⏭️  Task #{next_prompt['id']} skipped.\n")
+                continue
 
-        elif response == 'q':
-            print("\n👋 Exiting. Progress saved to execution_state.json\n")
-            return
+            elif response == 'q':
+                self.compact()
+                print("\n👋 Exiting. Progress saved to execution_state.json\n")
+                return
 
-        else:
-            print("Cancelled.\n")
+            else:
+                print("Cancelled.\n")
+                return
 
 
 def main():
@@ -290,24 +460,19 @@ def main():
 
         elif command == "complete":
             if len(sys.argv) < 3:
-                print("Usage: python prompt_executor.py complete <prompt_id> [notes]")
+                print("Usage: python prompt_executor.py complete <prompt_id>[,<prompt_id>...] [notes]")
                 return
 
-            prompt_id = int(sys.argv[2])
+            prompt_ids = [int(pid) for pid in sys.argv[2].split(",")]
             notes = sys.argv[3] if len(sys.argv) > 3 else ""
-            executor.mark_completed(prompt_id, notes)
-            print(f"✅ Task #{prompt_id} marked as completed!")
+            with executor.batch():
+                for prompt_id in prompt_ids:
+                    executor.mark_completed(prompt_id, notes)
+                    print(f"✅ Task #{prompt_id} marked as completed!")
 
         elif command == "reset":
             if input("Reset all progress? [y/n]: ").strip().lower() == 'y':
-                executor.state = {
-                    "completed_ids": [],
-                    "current_id": None,
-                    "started_at": None,
-                    "last_updated": None,
-                    "execution_log": []
-                }
-                executor._save_state()
+                executor.reset()
                 print("✓ Progress reset.")
 
         else:
@@ -315,7 +480,7 @@ def main():
             print("\nAvailable commands:")
             print("  progress        - Show execution progress")
             print("  next [count]    - Export next N prompts to file")
-            print("  complete <id>   - Mark prompt as completed")
+            print("  complete <ids>  - Mark prompt(s) as completed (comma-separated)")
             print("  reset           - Reset all progress")
 
     else:
@@ -1,11 +1,17 @@
+import re
+import secrets
 from datetime import datetime, timezone
 from enum import Enum
 from typing import List, Optional
-from uuid import uuid4
 
 from pydantic import BaseModel, Field
 
 
+def _new_id() -> str:
+    # Opaque 128-bit id; older entries carry dashed UUID strings, which stay valid.
+    return secrets.token_hex(16)
+
+
 class EntryCategory(str, Enum):
     NOTE = "note"
     PROGRESS = "progress"
@@ -42,7 +48,7 @@ class EntryCreate(EntryBase):
 
 
 class EntryNormalized(EntryBase):
-    id: str = Field(default_factory=lambda: str(uuid4()))
+    id: str = Field(default_factory=_new_id)
     created_at: datetime = Field(
         default_factory=lambda: datetime.now(timezone.utc),
         description="UTC timestamp when the entry was accepted by the service",
@@ -57,6 +63,12 @@ class EntryNormalized(EntryBase):
     )
 
 
+_LINE_END_RE = re.compile(r"\r\n?")
+# Any whitespace except the newline itself, up to the end of a line.
+_TRAILING_WS_RE = re.compile(r"[^\S\n]+(?=\n)")
+_BLANK_RUN_RE = re.compile(r"\n{3,}")
+
+
 def normalize_content(text: str) -> str:
     """
     Apply simple, stable normalization to free-text content.
@@ -69,21 +81,21 @@ def normalize_content(text: str) -> str:
     if not text:
         return ""
 
-    # Normalize line endings and strip outer whitespace
-    normalized = text.replace("\r\n", "\n").replace("\r", "\n").strip()
-
-    # Collapse multiple blank lines
-    lines = normalized.split("\n")
-    collapsed: list[str] = []
-    previous_blank = False
-    for line in lines:
-        is_blank = line.strip() == ""
-        if is_blank and previous_blank:
-            continue
-        collapsed.append(line.rstrip())
-        previous_blank = is_blank
+    # Already-clean input (the common case) is returned as-is, without copying.
+    if (
+        "\r" not in text
+        and not text[0].isspace()
+        and not text[-1].isspace()
+        and "\n\n\n" not in text
+        and _TRAILING_WS_RE.search(text) is None
+    ):
+        return text
 
-    return "\n".join(collapsed)
+    # Normalize line endings and strip outer whitespace
+    normalized = _LINE_END_RE.sub("\n", text).strip()
+    # Drop trailing whitespace on each line, then collapse runs of blank lines
+    normalized = _TRAILING_WS_RE.sub("", normalized)
+    return _BLANK_RUN_RE.sub("\n\n", normalized)
 
 
 def build_normalized_entry(
@@ -91,8 +103,9 @@ def build_normalized_entry(
     *,
     source: str,
 ) -> EntryNormalized:
-    return EntryNormalized(
-        **payload.model_dump(),
+    # `payload` is already validated, so skip re-validating every field.
+    return EntryNormalized.model_construct(
+        **payload.__dict__,
         source=source,
         content_normalized=normalize_content(payload.content_raw),
     )
@@ -116,6 +129,16 @@ class ArtifactType(str, Enum):
     NOTE = "Note"
 
 
+def _month_tag(created: datetime) -> str:
+    """YYYY-MM bucket for a timestamp, formatted directly rather than via strftime"""
+    return f"{created.year:04d}-{created.month:02d}"
+
+
+# Rendered "#Value" tags, fixed by the enums above.
+_VALUE_TAG_STR = {tag: f"#{tag.value}" for tag in ValueTag}
+_ARTIFACT_TAG_STR = {tag: f"#{tag.value}" for tag in ArtifactType}
+
+
 class LedgerEntryBase(BaseModel):
     title: str = Field(..., description="Short descriptor for quick scanning")
     summary: str = Field(..., description="Narrative summary / key outcomes")
@@ -135,7 +158,7 @@ class LedgerEntryCreate(LedgerEntryBase):
 
 
 class LedgerEntryNormalized(LedgerEntryBase):
-    id: str = Field(default_factory=lambda: str(uuid4()))
+    id: str = Field(default_factory=_new_id)
     created_at: datetime = Field(default_factory=lambda: datetime.now(timezone.utc))
     month_tag: str = Field(..., description="Derived #Month/YYYY-MM tag")
     tags: List[str] = Field(default_factory=list, description="Expanded tag list with prefixes")
@@ -150,18 +173,17 @@ def build_ledger_entry(
     actor: Optional[str] = None,
 ) -> LedgerEntryNormalized:
     created = datetime.now(timezone.utc)
-    month_tag = created.strftime("%Y-%m")
+    month_tag = _month_tag(created)
     tags = [
         f"#Theme/{payload.theme}",
         f"#Lens/{payload.lens}",
         f"#Month/{month_tag}",
+        *map(_VALUE_TAG_STR.__getitem__, payload.value_tags),
+        *map(_ARTIFACT_TAG_STR.__getitem__, payload.artifact_tags),
     ]
-    tags.extend(f"#{tag.value}" for tag in payload.value_tags)
-    tags.extend(f"#{tag.value}" for tag in payload.artifact_tags)
 
-    return LedgerEntryNormalized(
-        **payload.model_dump(),
-        id=str(uuid4()),
+    return LedgerEntryNormalized.model_construct(
+        **payload.__dict__,
         created_at=created,
         month_tag=month_tag,
         tags=tags,
@@ -192,15 +214,15 @@ class TodoEntryCreate(TodoEntryBase):
 
 
 class TodoEntryNormalized(TodoEntryBase):
-    id: str = Field(default_factory=lambda: str(uuid4()))
+    id: str = Field(default_factory=_new_id)
     created_at: datetime = Field(default_factory=lambda: datetime.now(timezone.utc))
     month_tag: str = Field(..., description="YYYY-MM bucket")
 
 
 def build_todo_entry(payload: TodoEntryCreate) -> TodoEntryNormalized:
     created = datetime.now(timezone.utc)
-    return TodoEntryNormalized(
-        **payload.model_dump(),
-        month_tag=created.strftime("%Y-%m"),
+    return TodoEntryNormalized.model_construct(
+        **payload.__dict__,
+        month_tag=_month_tag(created),
         created_at=created,
     )
@@ -1,6 +1,7 @@
 import json
 import logging
-from typing import Any, Dict, List, Optional, Tuple
+from typing import Any, AsyncIterator, Awaitable, Callable, Dict, List, Optional, Sequence, Tuple
+from urllib.parse import quote
 
 import httpx
 import msal
@@ -10,6 +11,13 @@ from .schemas import EntryNormalized
 
 logger = logging.getLogger(__name__)
 
+# Microsoft Graph accepts at most 20 requests per JSON batch.
+GRAPH_BATCH_MAX = 20
+
+# Downloads are relayed to the caller in chunks of this size.
+DOWNLOAD_CHUNK_SIZE = 64 * 1024
+
+
 class GraphClient:
     """
     Minimal Microsoft Graph client for uploading normalized entries into a drive.
@@ -85,6 +93,73 @@ class GraphClient:
         logger.info("Uploaded JSON document path=%s item=%s", path, item_id)
         return item_id
 
+    async def upload_json_documents(
+        self,
+        documents: Sequence[Tuple[Dict[str, Any], str, Optional[str]]],
+        *,
+        drive_id: Optional[str] = None,
+    ) -> List[str | Exception]:
+        """
+        Upload several `(payload, filename, subfolder)` JSON documents through
+        Graph JSON batching (`$batch`), up to GRAPH_BATCH_MAX per round trip.
+
+        Returns one result per document, in order: the new item id, or the
+        exception describing why that document (or its whole batch) failed.
+        """
+        if not documents:
+            return []
+
+        token = self._acquire_token()
+        drive = self._resolve_drive(drive_id)
+        results: List[str | Exception] = []
+
+        async with httpx.AsyncClient(timeout=30.0) as client:
+            for start in range(0, len(documents), GRAPH_BATCH_MAX):
+                chunk = documents[start : start + GRAPH_BATCH_MAX]
+                requests = [
+                    {
+                        "id": str(index),
+                        "method": "PUT",
+                        "url": f"/drives/{drive}/root:/{quote(self._compose_path(filename, subfolder=subfolder))}:/content",
+                        "headers": {"Content-Type": "application/json"},
+                        "body": payload,
+                    }
+                    for index, (payload, filename, subfolder) in enumerate(chunk)
+                ]
+
+                logger.info("Uploading %d JSON documents to drive=%s via $batch", len(chunk), drive)
+                try:
+                    response = await client.post(
+                        "https://graph.microsoft.com/v1.0/$batch",
+                        headers={
+                            "Authorization": f"Bearer {token}",
+                            "Content-Type": "application/json",
+                        },
+                        content=json.dumps({"requests": requests}),
+                    )
+                    response.raise_for_status()
+                except Exception as exc:
+                    logger.warning("Graph batch upload of %d documents failed: %s", len(chunk), exc)
+                    results.extend(exc for _ in chunk)
+                    continue
+
+                by_id = {str(r.get("id")): r for r in response.json().get("responses", [])}
+                for index in range(len(chunk)):
+                    item = by_id.get(str(index))
+                    if item is None:
+                        results.append(RuntimeError("No response for batched upload"))
+                        continue
+                    item_status = int(item.get("status", 0))
+                    body = item.get("body") or {}
+                    if 200 <= item_status < 300:
+                        results.append(str(body.get("id")))
+                    else:
+                        error = body.get("error") if isinstance(body, dict) else None
+                        message = (error or {}).get("message") if isinstance(error, dict) else None
+                        results.append(RuntimeError(f"Graph returned {item_status}: {message or 'upload failed'}"))
+
+        return results
+
     async def upload_entry(self, entry: EntryNormalized) -> str:
         """
         Upload a single normalized entry as JSON to the configured drive (under the configured folder).
@@ -130,13 +205,14 @@ class GraphClient:
         else:
             url = f"https://graph.microsoft.com/v1.0/drives/{drive}/root/children"
 
-        logger.debug(
-            "Listing children in drive=%s base=%s path=%s target=%s",
-            drive,
-            base_path,
-            path,
-            target_path or "/",
-        )
+        if logger.isEnabledFor(logging.DEBUG):
+            logger.debug(
+                "Listing children in drive=%s base=%s path=%s target=%s",
+                drive,
+                base_path,
+                path,
+                target_path or "/",
+            )
         async with httpx.AsyncClient(timeout=20.0) as client:
             response = await client.get(
                 url,
@@ -202,36 +278,62 @@ class GraphClient:
         logger.info("Discovered %d drives accessible to the app", len(drive_list))
         return drive_list
 
-    async def download_item(
+    async def stream_item(
         self,
         item_id: str,
         *,
         drive_id: str | None = None,
-    ) -> Tuple[bytes, str, str]:
+    ) -> Tuple[AsyncIterator[bytes], str, str, Callable[[], Awaitable[None]]]:
         """
-        Download a drive item (file) and return its bytes, content type, and name.
+        Open a drive item (file) for download and return a chunk iterator, its
+        content type, name, and an async close callback.
+
+        Metadata and status errors are raised before returning. The iterator
+        closes the underlying connection once exhausted, but it may never be
+        iterated (e.g. the client disconnects first), so callers must also
+        await the close callback when done; it is safe to call more than once.
         """
         token = self._acquire_token()
         drive = self._resolve_drive(drive_id)
+        headers = {"Authorization": f"Bearer {token}"}
 
         metadata_url = f"https://graph.microsoft.com/v1.0/drives/{drive}/items/{item_id}"
         content_url = f"{metadata_url}/content"
 
         logger.info("Downloading drive item %s from drive %s", item_id, drive)
-        async with httpx.AsyncClient(timeout=30.0) as client:
-            meta_resp = await client.get(metadata_url, headers={"Authorization": f"Bearer {token}"})
+        client = httpx.AsyncClient(timeout=30.0, follow_redirects=True)
+        try:
+            meta_resp = await client.get(metadata_url, headers=headers)
             meta_resp.raise_for_status()
-            meta = meta_resp.json()
-            name = str(meta.get("name", "download.bin"))
-
-            content_resp = await client.get(
-                content_url,
-                headers={"Authorization": f"Bearer {token}"},
-            )
-            content_resp.raise_for_status()
-            content_type = content_resp.headers.get("Content-Type", "application/octet-stream")
-            logger.info("Downloaded %s (%s bytes)", name, len(content_resp.content))
-            return content_resp.content, content_type, name
+            name = str(meta_resp.json().get("name", "download.bin"))
+
+            content_resp = await client.send(client.build_request("GET", content_url, headers=headers), stream=True)
+            if content_resp.is_error:
+                await content_resp.aread()
+                await content_resp.aclose()
+                content_resp.raise_for_status()
+        except BaseException:
+            await client.aclose()
+            raise
+
+        content_type = content_resp.headers.get("Content-Type", "application/octet-stream")
+
+        async def close() -> None:
+            # httpx makes both of these no-ops once already closed.
+            await content_resp.aclose()
+            await client.aclose()
+
+        async def chunks() -> AsyncIterator[bytes]:
+            sent = 0
+            try:
+                async for chunk in content_resp.aiter_bytes(chunk_size=DOWNLOAD_CHUNK_SIZE):
+                    sent += len(chunk)
+                    yield chunk
+            finally:
+                await close()
+                logger.info("Downloaded %s (%s bytes)", name, sent)
+
+        return chunks(), content_type, name, close
 
     async def health_check(self) -> bool:
         """
@@ -0,0 +1,83 @@
+from __future__ import annotations
+
+import os
+import re
+
+from starlette.datastructures import Headers
+from starlette.responses import Response
+from starlette.staticfiles import StaticFiles
+from starlette.types import Scope
+
+# Content-hashed names must carry an explicit marker, e.g. app.hash-3f9a1c2b.css.
+# A bare hex/digit run is not enough: report-20240101.pdf is not immutable.
+_HASHED_NAME_RE = re.compile(r"\.hash-[0-9a-f]{8,}\.[A-Za-z0-9]+$")
+
+IMMUTABLE_CACHE_CONTROL = "public, max-age=31536000, immutable"
+REVALIDATE_CACHE_CONTROL = "public, no-cache"
+
+# Extensions scripts/precompress_static.py writes `<file>.gz` siblings for.
+PRECOMPRESSED_EXTENSIONS = (".html", ".md", ".svg", ".css", ".js", ".json", ".txt")
+
+
+def _accepts_gzip(request_headers: Headers) -> bool:
+    for part in request_headers.get("accept-encoding", "").split(","):
+        coding, _, params = part.strip().partition(";")
+        if coding.strip().lower() not in ("gzip", "*"):
+            continue
+        q = params.strip()
+        if q.startswith("q=") and q[2:].strip() in ("0", "0.0", "0.00", "0.000"):
+            return False
+        return True
+    return False
+
+
+class CachedStaticFiles(StaticFiles):
+    """
+    StaticFiles with explicit Cache-Control and precompressed variants.
+
+    Starlette already sends ETag / Last-Modified and answers conditional GETs
+    with 304, so clients only need to be told how long to trust their copy:
+      - content-hashed names (`<name>.hash-<hex>.<ext>`) never change -> cache
+        for a year, immutable
+      - everything else (e.g. the uploadable logo) -> keep, but revalidate
+
+    If an up-to-date `<file>.gz` exists next to a text asset and the client
+    accepts gzip, that file is sent as-is with `Content-Encoding: gzip`.
+    """
+
+    def file_response(
+        self,
+        full_path: str | os.PathLike[str],
+        stat_result: os.stat_result,
+        scope: Scope,
+        status_code: int = 200,
+    ) -> Response:
+        path = os.fspath(full_path)
+        gz_stat = self._fresh_gzip_stat(path, stat_result)
+        if gz_stat is not None and _accepts_gzip(Headers(scope=scope)):
+            # The `.html.gz` name still guesses as text/html; ETag comes from the gz file.
+            response = super().file_response(path + ".gz", gz_stat, scope, status_code)
+            response.headers["Content-Encoding"] = "gzip"
+        else:
+            response = super().file_response(full_path, stat_result, scope, status_code)
+        if gz_stat is not None:
+            response.headers["Vary"] = "Accept-Encoding"
+
+        if _HASHED_NAME_RE.search(path):
+            response.headers["Cache-Control"] = IMMUTABLE_CACHE_CONTROL
+        else:
+            response.headers["Cache-Control"] = REVALIDATE_CACHE_CONTROL
+        return response
+
+    @staticmethod
+    def _fresh_gzip_stat(path: str, stat_result: os.stat_result) -> os.stat_result | None:
+        if not path.endswith(PRECOMPRESSED_EXTENSIONS):
+            return None
+        try:
+            gz_stat = os.stat(path + ".gz")
+        except OSError:
+            return None
+        # Ignore a stale .gz left behind after the source was edited.
+        if gz_stat.st_mtime < stat_result.st_mtime:
+            return None
+        return gz_stat
@@ -1,5 +1,6 @@
+import bisect
 import logging
-from typing import List
+from typing import List, Tuple
 
 from .schemas import TodoEntryCreate, TodoEntryNormalized, build_todo_entry
 from .sharepoint_client import graph_client
@@ -7,6 +8,11 @@ from .sharepoint_client import graph_client
 logger = logging.getLogger(__name__)
 
 
+def _list_order(entry: TodoEntryNormalized) -> Tuple[str, float]:
+    # Grouped by status, newest first within each group.
+    return entry.status, -entry.created_at.timestamp()
+
+
 class TodoService:
     """
     Lightweight task tracker stored directly in SharePoint under
@@ -14,7 +20,10 @@ class TodoService:
     """
 
     def __init__(self) -> None:
+        # Kept in list order on insert so reads never need to sort.
         self._entries: List[TodoEntryNormalized] = []
+        # Bumped on every append; list endpoints derive their ETag from it.
+        self.version = 0
 
     async def add_entry(self, payload: TodoEntryCreate) -> TodoEntryNormalized:
         entry = build_todo_entry(payload)
@@ -27,12 +36,13 @@ class TodoService:
             subfolder=subfolder,
         )
 
-        self._entries.append(entry)
+        bisect.insort(self._entries, entry, key=_list_order)
+        self.version += 1
         logger.info("Todo entry recorded id=%s title=%s", entry.id, entry.title)
         return entry
 
     def list_entries(self) -> List[TodoEntryNormalized]:
-        return sorted(self._entries, key=lambda e: (e.status, -e.created_at.timestamp()))
+        return list(self._entries)
 
 
 todo_service = TodoService()
@@ -2,6 +2,7 @@ from __future__ import annotations
 
 import json
 import logging
+import os
 from pathlib import Path
 from typing import List
 
@@ -44,5 +45,9 @@ def save_tools(path: Path | None = None) -> None:
         "version": 1,
         "tools": [t.model_dump(mode="json") for t in tool_registry.list_tools()],
     }
-    p.write_text(json.dumps(data, indent=2), encoding="utf-8")
+    # Write beside the target and rename over it so readers (and a crash mid-write)
+    # never see a truncated file.
+    tmp = p.with_name(p.name + ".tmp")
+    tmp.write_text(json.dumps(data, indent=2), encoding="utf-8")
+    os.replace(tmp, p)
     logger.info("Saved %d tools to %s", len(data["tools"]), p)
@@ -88,6 +88,8 @@ def _resolve_entrypoint(entrypoint: str) -> _ResolvedEntrypoint:
 class ToolRegistry:
     def __init__(self) -> None:
         self._tools: Dict[str, ToolSpec] = {}
+        # Bumped on every upsert/delete; the list endpoint caches by it.
+        self.version = 0
 
     def list_tools(self) -> List[ToolSpec]:
         return sorted(self._tools.values(), key=lambda t: t.id)
@@ -100,11 +102,13 @@ class ToolRegistry:
     def upsert(self, payload: ToolCreate) -> ToolSpec:
         spec = ToolSpec(**payload.model_dump())
         self._tools[spec.id] = spec
+        self.version += 1
         return spec
 
     def delete(self, tool_id: str) -> None:
         if tool_id in self._tools:
             del self._tools[tool_id]
+            self.version += 1
 
     def run(self, tool_id: str, request: ToolRunRequest) -> ToolRunResult:
         try:
@@ -0,0 +1,46 @@
+"""
+Write gzip-compressed `<file>.gz` siblings for text assets under app/static.
+
+CachedStaticFiles serves these directly to clients that accept gzip, so the
+server never compresses collateral HTML/MD/SVG at request time. Run it as part
+of a deploy (re-running only rewrites files whose source changed):
+
+    python scripts/precompress_static.py
+"""
+
+from __future__ import annotations
+
+import gzip
+import os
+import sys
+from pathlib import Path
+
+PROJECT_ROOT = Path(__file__).resolve().parents[1]
+sys.path.insert(0, str(PROJECT_ROOT))
+
+from app.static_files import PRECOMPRESSED_EXTENSIONS  # noqa: E402
+
+# Below this size the gzip framing overhead isn't worth it.
+MIN_SIZE_BYTES = 500
+
+
+def precompress(static_root: Path) -> int:
+    written = 0
+    for path in sorted(static_root.rglob("*")):
+        if not path.is_file() or not path.name.endswith(PRECOMPRESSED_EXTENSIONS):
+            continue
+        src_stat = path.stat()
+        if src_stat.st_size < MIN_SIZE_BYTES:
+            continue
+        gz_path = path.with_name(path.name + ".gz")
+        if gz_path.exists() and gz_path.stat().st_mtime >= src_stat.st_mtime:
+            continue
+        gz_path.write_bytes(gzip.compress(path.read_bytes(), compresslevel=9, mtime=0))
+        os.utime(gz_path, (src_stat.st_atime, src_stat.st_mtime))
+        written += 1
+    return written
+
+
+if __name__ == "__main__":
+    count = precompress(PROJECT_ROOT / "app" / "static")
+    print(f"Precompressed {count} static files")